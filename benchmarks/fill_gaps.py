@@ -0,0 +1,54 @@
+"""
+Gap filling of a sparse curveType A03 Period: a year of 15-minute positions
+(35,040 Points) of which 90% are elided.
+
+    PYTHONPATH=. python benchmarks/fill_gaps.py [--length 35040] [--elided 0.9] [--repeat 5]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from entsoe_client.Parsers import ParserUtils as utils
+
+
+def make_points(length: int, elided: float, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    kept = np.flatnonzero(rng.random(length) >= elided) + 1
+    kept = np.union1d(kept, [1])
+    return [{"position": str(position), "quantity": str(position % 997)} for position in kept]
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    argparser.add_argument("--length", type=int, default=35040)
+    argparser.add_argument("--elided", type=float, default=0.9)
+    argparser.add_argument("--repeat", type=int, default=5)
+    args = argparser.parse_args()
+
+    points = make_points(args.length, args.elided)
+    columns = utils.records_to_columns(points)
+    print(f"{len(points)} of {args.length} positions")
+    results = {
+        "fill_Period_data": best_of(
+            args.repeat, lambda: utils.fill_Period_data(list(points), args.length)
+        ),
+        "fill_Period_columns": best_of(
+            args.repeat, utils.fill_Period_columns, columns, args.length
+        ),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<20} {seconds * 1000:8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Point-in-time, window and hourly aggregation queries over `--outages` random
+outage segments of one year, as parsed with `intervals=True`.
+
+    PYTHONPATH=. python benchmarks/outage_index.py [--outages 100000] [--queries 2000] [--repeat 3]
+
+`scan` compares every segment against each query, `OutageIndex` queries the interval tree.
+`sweep` aggregates the unavailable MW per bidding zone over an hourly grid.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from entsoe_client.Utils.OutageIndex import BIDDING_ZONE, NOMINAL_POWER, OutageIndex
+
+
+def make_outages(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    minutes = rng.integers(0, 365 * 24 * 60, n)
+    starts = pd.Timestamp("2021-01-01T00:00Z") + pd.to_timedelta(minutes, unit="min")
+    ends = starts + pd.to_timedelta(rng.integers(15, 14 * 24 * 60, n), unit="min")
+    zones = [f"10Y{i:02d}" for i in range(30)]
+    return pd.DataFrame(
+        {
+            "end": ends,
+            "quantity": rng.integers(0, 400, n).astype(float),
+            BIDDING_ZONE: pd.Categorical(rng.choice(zones, n)),
+            NOMINAL_POWER: pd.Categorical(rng.choice(["400", "800", "1200"], n)),
+        },
+        index=starts,
+    )
+
+
+def scan(df: pd.DataFrame, times: pd.DatetimeIndex) -> int:
+    starts, ends = df.index.asi8, pd.DatetimeIndex(df["end"]).asi8
+    return sum(np.count_nonzero((starts <= t) & (ends > t)) for t in times.asi8)
+
+
+def stab(index: OutageIndex, times: pd.DatetimeIndex) -> int:
+    return sum(len(index.stab(t)) for t in times)
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    argparser.add_argument("--outages", type=int, default=100_000)
+    argparser.add_argument("--queries", type=int, default=2000)
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+
+    df = make_outages(args.outages)
+    times = pd.date_range("2021-01-01T00:00Z", "2022-01-01T00:00Z", periods=args.queries)
+    index = OutageIndex(df)
+    assert scan(df, times[:50]) == stab(index, times[:50])
+    grid = pd.date_range("2021-01-01T00:00Z", "2022-01-01T00:00Z", freq="1h")
+    print(f"{args.outages} outages, {args.queries} queries")
+    print(f"{'build':<20} {best_of(args.repeat, OutageIndex, df):8.3f}s")
+    print(f"{'scan':<20} {best_of(args.repeat, scan, df, times):8.3f}s")
+    print(f"{'OutageIndex':<20} {best_of(args.repeat, stab, index, times):8.3f}s")
+    print(f"{'sweep (hourly)':<20} {best_of(args.repeat, index.sweep, grid):8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Parse time of a large `GL_MarketDocument`, by default a year of 15-minute
+`AggregatedGenerationPerType` data for 10 production types.
+
+    PYTHONPATH=. python benchmarks/parse_gl_document.py [--days 365] [--series 10] [--resolution PT15M] [--repeat 3]
+
+Ten years of hourly data: `--days 3650 --series 1 --resolution PT60M`.
+
+`rewrite namespaces` times the pass that used to strip the namespace of every tag
+after deserialization, for comparison with the remaining parse time.
+Finally, the memory of the resulting DataFrame is reported with categorical
+and with string metadata columns, and of the normalized `series` and `values` tables.
+"""
+import argparse
+import time
+
+import pandas as pd
+from lxml import etree, objectify
+
+from entsoe_client.Parsers import ParserUtils as utils
+from entsoe_client.Parsers import Sinks, XMLParser
+
+NAMESPACE = "urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0"
+
+
+def make_document(days: int, series: int, resolution: str = "PT15M") -> bytes:
+    start = pd.Timestamp("2021-01-01T00:00Z")
+    points = int(pd.Timedelta("1D") / pd.Timedelta(utils.resolution_map[resolution]))
+    parts = [
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<GL_MarketDocument xmlns="{NAMESPACE}">'
+        "<mRID>benchmark</mRID><revisionNumber>1</revisionNumber><type>A75</type>"
+        "<process.processType>A16</process.processType>"
+        "<createdDateTime>2022-01-01T00:00:00Z</createdDateTime>"
+    ]
+    for s in range(series):
+        parts.append(
+            f"<TimeSeries><mRID>{s + 1}</mRID><businessType>A01</businessType>"
+            "<objectAggregation>A08</objectAggregation>"
+            '<inBiddingZone_Domain.mRID codingScheme="A01">10Y1001A1001A82H</inBiddingZone_Domain.mRID>'
+            "<quantity_Measure_Unit.name>MAW</quantity_Measure_Unit.name><curveType>A01</curveType>"
+            f"<MktPSRType><psrType>B{s + 1:02d}</psrType></MktPSRType>"
+        )
+        for day in range(days):
+            period_start = start + pd.Timedelta(days=day)
+            period_end = period_start + pd.Timedelta(days=1)
+            parts.append(
+                f"<Period><timeInterval><start>{period_start:%Y-%m-%dT%H:%MZ}</start>"
+                f"<end>{period_end:%Y-%m-%dT%H:%MZ}</end></timeInterval>"
+                f"<resolution>{resolution}</resolution>"
+            )
+            parts.extend(
+                f"<Point><position>{i}</position><quantity>{(i * 7 + day) % 1000}</quantity></Point>"
+                for i in range(1, points + 1)
+            )
+            parts.append("</Period>")
+        parts.append("</TimeSeries>")
+    parts.append("</GL_MarketDocument>")
+    return "".join(parts).encode("utf-8")
+
+
+def rewrite_namespaces(document: bytes) -> None:
+    tree = objectify.fromstring(document)
+    for elem in tree.getiterator():
+        elem.tag = etree.QName(elem).localname
+    etree.cleanup_namespaces(tree)
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    argparser.add_argument("--days", type=int, default=365)
+    argparser.add_argument("--series", type=int, default=10)
+    argparser.add_argument("--resolution", default="PT15M", choices=["PT15M", "PT30M", "PT60M"])
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+
+    document = make_document(args.days, args.series, args.resolution)
+    print(f"{len(document) / 2**20:.1f} MiB, {args.days} days x {args.series} TimeSeries")
+    deserialize = best_of(args.repeat, objectify.fromstring, document)
+    rewrite = best_of(args.repeat, rewrite_namespaces, document) - deserialize
+    results = {
+        "deserialize": deserialize,
+        "rewrite namespaces": rewrite,
+        "parse (objectify)": best_of(args.repeat, XMLParser().parse, document),
+        "parse (iterparse)": best_of(args.repeat, XMLParser(engine="iterparse").parse, document),
+    }
+    for sink in ["pyarrow", "polars"]:
+        try:
+            Sinks.get_sink(sink)
+        except ImportError:  # Optional dependency.
+            continue
+        results[f"parse ({sink})"] = best_of(args.repeat, XMLParser(sink=sink).parse, document)
+    for name, seconds in results.items():
+        print(f"{name:<20} {seconds:8.3f}s")
+    for categorical in (True, False):
+        df = XMLParser(categorical=categorical).parse(document)
+        megabytes = df.memory_usage(deep=True).sum() / 2**20
+        print(f"{'memory (categorical)' if categorical else 'memory (strings)':<20} {megabytes:8.1f} MiB")
+    tables = XMLParser(normalized=True).parse(document)
+    megabytes = sum(df.memory_usage(deep=True).sum() for df in tables if df is not None) / 2**20
+    print(f"{'memory (normalized)':<20} {megabytes:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
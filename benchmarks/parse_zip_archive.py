@@ -0,0 +1,68 @@
+"""
+Parse time of a ZIP archive of outage documents, one `Unavailability_MarketDocument`
+per member as returned by the outage queries, by number of worker processes.
+Peak memory of `parse` is compared with consuming `iter_parse` member by member.
+
+    PYTHONPATH=. python benchmarks/parse_zip_archive.py [--documents 2000] [--workers 1 2 4] [--repeat 3]
+"""
+import argparse
+import os
+import time
+import tracemalloc
+from io import BytesIO
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from entsoe_client.Parsers import ZipParser
+
+TEMPLATE = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "data", "Unavailability_MarketDocument",
+    "A78_UnavailabilityOfTransmissionInfrastructure.xml",
+)
+
+
+def make_archive(documents: int) -> bytes:
+    with open(TEMPLATE, "rb") as template:
+        document = template.read()
+    buffer = BytesIO()
+    with ZipFile(buffer, "w", ZIP_DEFLATED) as archive:
+        for i in range(documents):
+            archive.writestr(
+                f"{i}.xml", document.replace(b"bD1LfDyMQRwKqo6J1p0ZTg", f"document{i}".encode())
+            )
+    return buffer.getvalue()
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    argparser.add_argument("--documents", type=int, default=2000)
+    argparser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+
+    archive = make_archive(args.documents)
+    print(f"{len(archive) / 2**20:.1f} MiB, {args.documents} documents, {os.cpu_count()} CPUs")
+    for workers in args.workers:
+        seconds = best_of(args.repeat, ZipParser(workers=workers).parse, archive)
+        print(f"{f'workers={workers}':<20} {seconds:8.3f}s")
+    for name, consume in [
+        ("parse", lambda: ZipParser().parse(archive)),
+        ("iter_parse", lambda: sum(len(df) for df in ZipParser().iter_parse(archive))),
+    ]:
+        tracemalloc.start()
+        consume()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{f'peak ({name})':<20} {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Construction of the timestamps of many Periods, by default ten years of daily
+15-minute Periods as returned for `ActualTotalLoad`, for `--series` TimeSeries
+repeating the same Periods.
+
+    PYTHONPATH=. python benchmarks/period_index.py [--days 3650] [--series 1] [--resolution PT15M] [--repeat 3]
+
+`date_range` is the former per-Period `pd.date_range` and `DatetimeIndex.append`,
+`Period_timestamps` the arithmetic construction into one preallocated array.
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from entsoe_client.Parsers import ParserUtils as utils
+
+
+def make_Periods(days: int, series: int):
+    starts = pd.date_range("2012-01-01T00:00Z", periods=days + 1, freq="1D")
+    Periods = [
+        (f"{start:%Y-%m-%dT%H:%MZ}", f"{end:%Y-%m-%dT%H:%MZ}")
+        for start, end in zip(starts[:-1], starts[1:])
+    ]
+    return Periods * series
+
+
+def date_range(Periods, resolution: str) -> pd.DatetimeIndex:
+    indexes = []
+    for start, end in Periods:
+        index = pd.date_range(start, end, freq=utils.resolution_map[resolution])
+        indexes.append(index[:-1] if index.size > 1 else index)
+    return indexes[0].append(indexes[1:])
+
+
+def Period_timestamps(Periods, resolution: str) -> pd.DatetimeIndex:
+    utils.Period_timestamps.cache_clear()
+    parts = [utils.Period_timestamps(start, end, resolution) for start, end in Periods]
+    timestamps = np.concatenate(parts)
+    return pd.DatetimeIndex(timestamps.view("datetime64[ns]")).tz_localize("UTC")
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    argparser.add_argument("--days", type=int, default=3650)
+    argparser.add_argument("--series", type=int, default=1)
+    argparser.add_argument("--resolution", default="PT15M", choices=["PT15M", "PT30M", "PT60M"])
+    argparser.add_argument("--repeat", type=int, default=3)
+    args = argparser.parse_args()
+
+    Periods = make_Periods(args.days, args.series)
+    assert date_range(Periods[:10], args.resolution).equals(
+        Period_timestamps(Periods[:10], args.resolution)
+    )
+    print(f"{len(Periods)} Periods of {args.resolution}")
+    for name, fn in [("date_range", date_range), ("Period_timestamps", Period_timestamps)]:
+        print(f"{name:<20} {best_of(args.repeat, fn, Periods, args.resolution):8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""
+Persistent response cache.
+
+Responses are stored in a SQLite database, keyed by a hash of the canonical query
+parameters. The `securityToken` is never part of the key, so a cache can be shared
+between API keys. The least recently used entries are evicted once `max_bytes` is exceeded.
+An optional `CachePolicy` assigns each entry an expiry from its document type and
+from how far `periodEnd` lies in the past.
+
+Cache hits are returned as `requests.Response`, hence `Parser.parse` consumes them
+like any downloaded response.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from datetime import timedelta
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+import requests
+
+from .Queries.Query import Query
+
+EXCLUDED_PARAMETERS = ("securityToken",)
+
+# Seconds a response stays valid while its data may still change, by DocumentType.
+VOLATILE_TTL: Dict[str, float] = {
+    "A44": 3600.0,  # Price Document
+    "A65": 900.0,  # System total load
+    "A69": 900.0,  # Wind and solar forecast
+    "A70": 3600.0,  # Load forecast margin
+    "A71": 3600.0,  # Generation forecast
+    "A73": 900.0,  # Actual generation
+    "A74": 900.0,  # Wind and solar generation
+    "A75": 900.0,  # Actual generation per type
+    "A76": 900.0,  # Load unavailability
+    "A77": 900.0,  # Production unavailability
+    "A78": 900.0,  # Transmission unavailability
+    "A79": 900.0,  # Offshore grid infrastructure unavailability
+    "A80": 900.0,  # Generation unavailability
+    "A85": 900.0,  # Imbalance prices
+    "A86": 900.0,  # Imbalance volume
+}
+
+# Time after `periodEnd` from which a response is final, by DocumentType.
+# `None` marks documents that may be revised at any time, e.g. outages.
+SETTLES_AFTER: Dict[str, Optional[timedelta]] = {
+    "A44": timedelta(days=1),
+    "A69": timedelta(days=1),
+    "A70": timedelta(days=1),
+    "A71": timedelta(days=1),
+    "A76": None,
+    "A77": None,
+    "A78": None,
+    "A79": None,
+    "A80": None,
+}
+
+
+def canonical_key(params: Dict) -> str:
+    """sha256 over the sorted, non-empty query parameters."""
+    canonical = {
+        k: str(v)
+        for (k, v) in params.items()
+        if v is not None and k not in EXCLUDED_PARAMETERS
+    }
+    serialized = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def parse_period(period) -> Optional[pd.Timestamp]:
+    """`Query` datetimes are integers of format `%Y%m%d%H%M` in UTC."""
+    if period is None:
+        return None
+    return Query.timestamp_parser(period)
+
+
+class CachePolicy:
+    """
+    Time-to-live of cached responses.
+
+    A response whose `periodEnd` lies further in the past than its document type
+    needs to settle never expires. Anything younger, i.e. the volatile tail of the data,
+    expires after the document type's volatile TTL. Documents that never settle
+    expire after `revisable_ttl` once their period is over.
+    """
+
+    def __init__(
+        self,
+        volatile_ttl: Optional[Dict[str, float]] = None,
+        settles_after: Optional[Dict[str, Optional[timedelta]]] = None,
+        default_volatile_ttl: float = 3600.0,
+        default_settles_after: Optional[timedelta] = timedelta(days=7),
+        revisable_ttl: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.volatile_ttl = {**VOLATILE_TTL, **(volatile_ttl or {})}
+        self.settles_after = {**SETTLES_AFTER, **(settles_after or {})}
+        self.default_volatile_ttl = default_volatile_ttl
+        self.default_settles_after = default_settles_after
+        self.revisable_ttl = revisable_ttl
+        self.clock = clock
+
+    def now(self) -> pd.Timestamp:
+        return pd.Timestamp(self.clock(), unit="s", tz="UTC")
+
+    def settled_before(self, document_type: Optional[str]) -> Optional[pd.Timestamp]:
+        """Data ending before the returned timestamp is final; `None` if it never is."""
+        settles_after = self.settles_after.get(document_type, self.default_settles_after)
+        if settles_after is None:
+            return None
+        return self.now() - settles_after
+
+    def ttl(self, params: Dict) -> Optional[float]:
+        """Seconds until a response to `params` expires; `None` if it never does."""
+        document_type = params.get("documentType")
+        volatile_ttl = self.volatile_ttl.get(document_type, self.default_volatile_ttl)
+        period_end = parse_period(params.get("periodEnd"))
+        if period_end is None:
+            return volatile_ttl
+        settled_before = self.settled_before(document_type)
+        if settled_before is None:
+            return self.revisable_ttl if period_end <= self.now() else volatile_ttl
+        if period_end <= settled_before:
+            return None
+        return volatile_ttl
+
+    def __call__(self, params: Dict) -> Optional[float]:
+        return self.ttl(params)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 2**30,
+        policy: Optional[CachePolicy] = None,
+        timeout: float = 30.0,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.timeout = timeout
+        connection = self._connect()
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "content BLOB NOT NULL, "
+                "content_type TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "created REAL NOT NULL, "
+                "accessed REAL NOT NULL, "
+                "expires REAL)"
+            )
+            columns = [row[1] for row in connection.execute("PRAGMA table_info(responses)")]
+            if "expires" not in columns:
+                connection.execute("ALTER TABLE responses ADD COLUMN expires REAL")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    @staticmethod
+    def to_response(content: bytes, content_type: str) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers["Content-Type"] = content_type
+        response._content = content
+        response.from_cache = True
+        return response
+
+    def get(self, params: Dict) -> Optional[requests.Response]:
+        key = canonical_key(params)
+        now = time.time()
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT content, content_type FROM responses "
+                "WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+        finally:
+            connection.close()
+        content, content_type = row
+        return self.to_response(bytes(content), content_type)
+
+    def put(self, params: Dict, response: requests.Response) -> None:
+        ttl = self.policy(params) if self.policy is not None else None
+        if ttl is not None and ttl <= 0:
+            return
+        fileobj = getattr(response, "fileobj", None)  # Streamed download.
+        if fileobj is not None:
+            # Size first: a spooled response may be far too large to read into memory.
+            fileobj.seek(0, os.SEEK_END)
+            size = fileobj.tell()
+            fileobj.seek(0)
+            if size > self.max_bytes:
+                return
+            content = fileobj.read()
+            fileobj.seek(0)
+        else:
+            content = response.content
+        if len(content) > self.max_bytes:
+            return
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, content, content_type, size, created, accessed, expires) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    canonical_key(params),
+                    sqlite3.Binary(content),
+                    response.headers["Content-Type"],
+                    len(content),
+                    now,
+                    now,
+                    expires,
+                ),
+            )
+            self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Deletes expired, then least recently used entries until the cache fits into `max_bytes`."""
+        connection.execute(
+            "DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?",
+            (time.time(),),
+        )
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed ASC, rowid ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def delete(self, params: Dict) -> None:
+        connection = self._connect()
+        try:
+            connection.execute(
+                "DELETE FROM responses WHERE key = ?", (canonical_key(params),)
+            )
+        finally:
+            connection.close()
+
+    def clear(self) -> None:
+        connection = self._connect()
+        try:
+            connection.execute("DELETE FROM responses")
+        finally:
+            connection.close()
+
+    def size(self) -> int:
+        connection = self._connect()
+        try:
+            (total,) = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        finally:
+            connection.close()
+        return total
+
+    def __len__(self) -> int:
+        connection = self._connect()
+        try:
+            (count,) = connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+        finally:
+            connection.close()
+        return count
+
+    def __contains__(self, params: Dict) -> bool:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT 1 FROM responses "
+                "WHERE key = ? AND (expires IS NULL OR expires > ?)",
+                (canonical_key(params), time.time()),
+            ).fetchone()
+        finally:
+            connection.close()
+        return row is not None
@@ -1,14 +1,41 @@
+import asyncio
+import functools
 import logging
-from typing import Dict, Optional
+import tempfile
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import AsyncIterator, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
 
+import pandas as pd
 import requests
-import tenacity
 from lxml import etree
 
+from .Cache import ResponseCache, canonical_key
+from .Parsers import ParserUtils
+from .Parsers.Parser import Parser
 from .Queries.Query import Query
+from .RateLimiter import RateLimiter
+from .Retry import CircuitBreaker, RetryPolicy
+from .Utils.SingleFlight import SingleFlight
 
 URL = "https://web-api.tp.entsoe.eu/api"
-retry_count = 1
+# Default number of attempts per request, see `RetryPolicy`.
+retry_count = 4
+# Streamed responses are kept in memory up to this size, then rolled over to disk.
+spool_max_size = 2**24
+
+
+class DownloadResult(NamedTuple):
+    """Outcome of a single download in a batch; exactly one of `response`, `exception` is set."""
+
+    query: Query
+    response: Optional[requests.Response] = None
+    exception: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
 
 
 class Client:
@@ -18,6 +45,20 @@ class Client:
     Requires an API Key for access.
 
     `_request` parses a Dict for the API call.
+    An optional `rate_limiter` is acquired before every request,
+    e.g. `TokenBucket.per_minute()` to stay below the ENTSO-E quota.
+    An optional `cache` serves repeated queries from disk.
+    Transient failures are retried according to `retry_policy`; the default policy
+    backs off exponentially and pauses all threads while the API is down.
+    With `coalesce`, concurrent identical queries share one request and one parse.
+
+    `session` is used as is on the constructing thread only, as `requests.Session` is not
+    thread-safe. Other threads use copies of it, see `_clone_session`: its headers,
+    cookies, auth, proxies, verify, cert etc. apply and its mounted adapters are shared.
+
+    The batch API, `download_many`, `download_paginated` and `download_dataframe`,
+    downloads on a thread pool. `AsyncClient` overrides it with coroutines, hence its
+    implementation only calls the synchronous `_download_query` and `_download_many`.
 
     Documentation:
     https://transparency.entsoe.eu/content/static_content/Static%20content/web%20api/Guide.html#_request_methods
@@ -29,6 +70,10 @@ class Client:
         session: Optional[requests.Session] = None,
         proxies: Optional[Dict] = None,
         timeout: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalesce: bool = True,
     ):
         if api_key:
             self.api_key = api_key
@@ -37,19 +82,56 @@ class Client:
         self.session = session if session else requests.Session()
         self.proxies = proxies
         self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.retry_policy = (
+            retry_policy
+            if retry_policy is not None
+            else RetryPolicy(max_attempts=retry_count, circuit_breaker=CircuitBreaker())
+        )
+        self._single_flight = SingleFlight() if coalesce else None
+        # requests.Session is not thread-safe; threads other than the
+        # constructing one get their own copy of it on first use.
+        self._local = threading.local()
+        self._local.session = self.session
 
-    @tenacity.retry(
-        stop=tenacity.stop_after_attempt(retry_count),
-        wait=tenacity.wait_fixed(1),
-        reraise=True,
-    )
-    def _request(self, params: Dict) -> requests.Response:
-        params.update({"securityToken": self.api_key})
+    def _get_session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._clone_session(self.session)
+            self._local.session = session
+        return session
+
+    @staticmethod
+    def _clone_session(session: requests.Session) -> requests.Session:
+        """
+        Shallow copy of `session` with copies of its mutable configuration, i.e. of the
+        containers among `requests.Session.__attrs__`. Adapters are shared: their
+        urllib3 connection pools are thread-safe, and custom ones stay in use.
+        """
+        clone = object.__new__(type(session))
+        clone.__dict__.update(session.__dict__)
+        for attr in getattr(session, "__attrs__", ()):
+            value = getattr(session, attr)
+            setattr(clone, attr, value.copy() if hasattr(value, "copy") else value)
+        return clone
 
+    def _request(self, params: Dict, stream: bool = False) -> requests.Response:
         logging.debug(f"{params}")
-        response = self.session.get(
-            url=URL, params=params, proxies=self.proxies, timeout=self.timeout
-        )
+        params = {**params, "securityToken": self.api_key}
+
+        def send() -> requests.Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            return self._get_session().get(
+                url=URL,
+                params=params,
+                proxies=self.proxies,
+                timeout=self.timeout,
+                stream=stream,
+            )
+
+        response = self.retry_policy.call(send)
 
         return response
 
@@ -68,11 +150,334 @@ class Client:
         else:
             return response
 
-    def download(self, query: Query) -> requests.Response:
+    @staticmethod
+    def _spool_response(response: requests.Response) -> requests.Response:
+        """
+        Copies the body of a streamed response into a temporary file, `response.fileobj`,
+        which `Parser.parse` reads instead of `response.content`.
+        """
+        fileobj = tempfile.SpooledTemporaryFile(max_size=spool_max_size)
+        try:
+            for chunk in response.iter_content(chunk_size=2**16):
+                fileobj.write(chunk)
+        except BaseException:
+            fileobj.close()
+            raise
+        finally:
+            response.close()
+        fileobj.seek(0)
+        response.fileobj = fileobj
+        return response
+
+    def download(self, query: Query, stream: bool = False) -> requests.Response:
+        """
+        With `stream`, the response body is spooled to a temporary file instead of
+        being buffered in `response.content`; see `_spool_response`.
+        Streamed downloads are never coalesced, as their file cannot be shared.
+        """
+        return self._download_query(query, stream=stream)
+
+    def _download_query(self, query: Query, stream: bool = False) -> requests.Response:
         params: Dict = query()
-        response: requests.Response = self._request(params)
+        if self._single_flight is None or stream:
+            return self._download(params, stream=stream)
+        response, _ = self._single_flight.do(
+            ("download", canonical_key(params)), lambda: self._download(params)
+        )
+        return response
+
+    def _download(self, params: Dict, stream: bool = False) -> requests.Response:
+        if self.cache is not None:
+            cached_response = self.cache.get(params)
+            if cached_response is not None:
+                return cached_response
+        response: requests.Response = self._request(params, stream=stream)
+        if stream and response.ok:
+            response = self._spool_response(response)
         validated_response = self._validate_response(response)
+        if self.cache is not None and validated_response.ok:
+            self.cache.put(params, validated_response)
         return validated_response
 
+    def _download_result(self, query: Query) -> DownloadResult:
+        try:
+            return DownloadResult(query, response=self._download_query(query))
+        except Exception as e:
+            logging.debug(f"{type(query).__name__}: {e!r}")
+            return DownloadResult(query, exception=e)
+
+    def download_many(
+        self, queries: Iterable[Query], max_workers: int = 4, ordered: bool = True
+    ) -> Iterator[DownloadResult]:
+        """
+        Downloads `queries` on a thread pool of `max_workers` threads, each with its
+        own copy of the client's session.
+
+        Yields a `DownloadResult` per query, in input order if `ordered`,
+        else as the downloads complete. Failing queries do not abort the batch;
+        their exception is captured in the result.
+        """
+        return self._download_many(queries, max_workers=max_workers, ordered=ordered)
+
+    def _download_many(
+        self, queries: Iterable[Query], max_workers: int = 4, ordered: bool = True
+    ) -> Iterator[DownloadResult]:
+        queries = list(queries)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="entsoe_client"
+        ) as executor:
+            futures = [executor.submit(self._download_result, query) for query in queries]
+            for future in futures if ordered else as_completed(futures):
+                yield future.result()
+
+    def download_paginated(self, query: Query, max_workers: int = 4) -> requests.Response:
+        """
+        Downloads all pages of a query limited to `query.document_limit` documents per response
+        and merges them into one response.
+
+        The first page tells whether more pages exist; further offsets are then
+        downloaded `max_workers` at a time until a page is not full or `query.offset_limit`
+        is reached. Warns if the API's document ceiling is hit, as documents are
+        missing then and the period should be narrowed.
+        """
+        return self._download_paginated(query, max_workers=max_workers)
+
+    def _download_paginated(self, query: Query, max_workers: int = 4) -> requests.Response:
+        limit = query.document_limit
+        if limit is None:
+            raise ValueError(f"{type(query).__name__} does not page through offset.")
+        offsets = list(range(query.offset or 0, query.offset_limit + 1, limit))
+        first_page = self._download_query(query.with_offset(offsets[0]))
+        count = Parser.count_documents(first_page)
+        pages = [first_page] if count else []
+        remaining_offsets = offsets[1:]
+        while count >= limit and remaining_offsets:
+            wave = remaining_offsets[:max_workers]
+            remaining_offsets = remaining_offsets[max_workers:]
+            queries = [query.with_offset(offset) for offset in wave]
+            for result in self._download_many(queries, max_workers=max_workers):
+                if not result.ok:
+                    raise result.exception
+                count = Parser.count_documents(result.response)
+                if count:
+                    pages.append(result.response)
+                if count < limit:
+                    break
+        if count >= limit:
+            warnings.warn(
+                f"{type(query).__name__}: reached the limit of "
+                f"{query.offset_limit + limit} documents, narrow the period "
+                f"[{query.periodStart}, {query.periodEnd}] to download all documents."
+            )
+        if not pages:
+            return first_page
+        return Parser.merge(pages)
+
+    def download_dataframe(
+        self,
+        query: Query,
+        max_workers: int = 4,
+        range_limit: Optional[pd.DateOffset] = None,
+        engine: str = "objectify",
+        **options,
+    ) -> pd.DataFrame:
+        """
+        Downloads and parses `query` into a single DataFrame.
+
+        The period is split into chunks no longer than `range_limit`,
+        defaulting to `query.range_limit`, which are downloaded concurrently.
+        With a cache policy, chunks are also cut where the data settles, so that
+        repeated calls only download the volatile tail again.
+        Queries with a `document_limit` are paged through `offset` per chunk.
+        Raises the first exception of any failed chunk.
+        `engine` selects the XML parser and `options` are passed to the
+        document parser, e.g. `float_dtype` or `normalized`, see `Parser.parse`;
+        `workers` processes parse the members of ZIP archives.
+        Concurrent calls for the same query share one result; all but the first
+        caller receive a copy, except of immutable pyarrow tables.
+        """
+        if self._single_flight is None:
+            return self._download_dataframe(
+                query, max_workers, range_limit, engine, **options
+            )
+        key = (
+            "dataframe",
+            canonical_key(query()),
+            str(range_limit),
+            engine,
+            repr(sorted(options.items())),
+        )
+        df, shared = self._single_flight.do(
+            key,
+            lambda: self._download_dataframe(
+                query, max_workers, range_limit, engine, **options
+            ),
+        )
+        if shared:
+            return ParserUtils.copy_frame(df)
+        return df
+
+    def _download_dataframe(
+        self,
+        query: Query,
+        max_workers: int,
+        range_limit: Optional[pd.DateOffset],
+        engine: str = "objectify",
+        **options,
+    ) -> pd.DataFrame:
+        boundaries = []
+        if self.cache is not None and self.cache.policy is not None:
+            settled_before = self.cache.policy.settled_before(query().get("documentType"))
+            if settled_before is not None:
+                boundaries.append(settled_before.floor("D"))
+        queries = query.split(range_limit=range_limit, boundaries=boundaries)
+        if query.document_limit is not None:
+            return Parser.parse_many(
+                (
+                    self._download_paginated(chunk, max_workers=max_workers)
+                    for chunk in queries
+                ),
+                engine=engine,
+                **options,
+            )
+        responses = []
+        for result in self._download_many(queries, max_workers=max_workers):
+            if not result.ok:
+                raise result.exception
+            responses.append(result.response)
+        return Parser.parse_many(responses, engine=engine, **options)
+
     def __call__(self, query: Query):
         return self.download(query)
+
+
+class AsyncClient(Client):
+    """
+    asyncio interface on top of `Client`.
+
+    `requests` is blocking, so each download runs on a worker thread with its own
+    copy of `session` while the event loop only awaits the result. At most `max_concurrency`
+    requests are in flight at any time, across all `download` and `download_many` calls
+    and the batch methods' thread pools.
+
+    >>> async with AsyncClient(api_key, max_concurrency=16) as client:
+    ...     async for query, response in client.download_many(queries):
+    ...         df = Parser.parse(response)
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        session: Optional[requests.Session] = None,
+        proxies: Optional[Dict] = None,
+        timeout: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        coalesce: bool = True,
+        max_concurrency: int = 8,
+    ):
+        super(AsyncClient, self).__init__(
+            api_key=api_key,
+            session=session,
+            proxies=proxies,
+            timeout=timeout,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            retry_policy=retry_policy,
+            coalesce=coalesce,
+        )
+        if max_concurrency < 1:
+            raise ValueError(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="entsoe_client"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Batch methods download on their own threads; all downloads share these slots.
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semaphores are bound to the loop they are first used in."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _download(self, params: Dict, stream: bool = False) -> requests.Response:
+        with self._slots:
+            return super(AsyncClient, self)._download(params, stream=stream)
+
+    async def download(self, query: Query, stream: bool = False) -> requests.Response:
+        loop = asyncio.get_running_loop()
+        download = functools.partial(self._download_query, query, stream=stream)
+        async with self._get_semaphore():
+            return await loop.run_in_executor(self._executor, download)
+
+    async def download_many(
+        self, queries: Iterable[Query]
+    ) -> AsyncIterator[Tuple[Query, requests.Response]]:
+        """
+        Batch API of `AsyncClient`, in place of `Client.download_many`:
+        yields `(query, response)` pairs in order of completion, each download bounded
+        by `max_concurrency`. Exceptions of individual downloads propagate on iteration.
+        """
+
+        async def _download(query: Query) -> Tuple[Query, requests.Response]:
+            return query, await self.download(query)
+
+        tasks = [asyncio.ensure_future(_download(query)) for query in queries]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_batch(self, fn, *args, max_workers: int, **kwargs):
+        """
+        Runs a synchronous batch method of `Client` on the loop's default executor.
+        Its thread pool is capped at `max_concurrency` threads, and its downloads wait
+        for the client's slots, see `_download`.
+        """
+        loop = asyncio.get_running_loop()
+        batch = functools.partial(
+            fn, self, *args, max_workers=min(max_workers, self.max_concurrency), **kwargs
+        )
+        return await loop.run_in_executor(None, batch)
+
+    async def download_paginated(self, query: Query, max_workers: int = 4) -> requests.Response:
+        """See `Client.download_paginated`."""
+        return await self._run_batch(Client._download_paginated, query, max_workers=max_workers)
+
+    async def download_dataframe(
+        self,
+        query: Query,
+        max_workers: int = 4,
+        range_limit: Optional[pd.DateOffset] = None,
+        engine: str = "objectify",
+        **options,
+    ) -> pd.DataFrame:
+        """See `Client.download_dataframe`."""
+        return await self._run_batch(
+            Client.download_dataframe,
+            query,
+            max_workers=max_workers,
+            range_limit=range_limit,
+            engine=engine,
+            **options,
+        )
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    async def __call__(self, query: Query):
+        return await self.download(query)
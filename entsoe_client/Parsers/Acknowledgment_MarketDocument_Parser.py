@@ -41,5 +41,6 @@ class Acknowledgment_MarketDocument_Parser(Abstract_Acknowledgment_MarketDocumen
         index = [df.index[0], df.index[-1], df.index[-2]]
         index.extend(df.index[1:-2])
         df = df.reindex(index=index)
+        df.attrs["acknowledgement"] = True
 
         return df
@@ -38,12 +38,10 @@ class Balancing_MarketDocument_Parser(Abstract_Balancing_MarketDocument_Parser):
         self.set_TimeSeries_Parser(
             utils.Tree_to_DataFrame(self.Series_Period_Parser, "Period")
         )
-        self.set_Document_Parser(
-            utils.Tree_to_DataFrame(self.TimeSeries_Parser, "TimeSeries")
-        )
+        self.set_Document_Parser(utils.StandardDocumentParser)
 
     def parse(self):
-        return self.Document_Parser(self.objectified_input_xml)
+        return self.Document_Parser(self.objectified_input_xml, **self.options)
 
 
 class Balancing_MarketDocument_FinancialExpensesAndIncomeForBalancing_Parser(
@@ -60,8 +58,8 @@ class Balancing_MarketDocument_FinancialExpensesAndIncomeForBalancing_Parser(
             utils.Tree_to_DataFrame(self.Series_Period_Parser, "Period")
         )
         self.set_Document_Parser(
-            utils.Tree_to_DataFrame(self.TimeSeries_Parser, "TimeSeries")
+            utils.Document_to_DataFrame(utils.get_Period_Financial_Price_columns)
         )
 
     def parse(self):
-        return self.Document_Parser(self.objectified_input_xml)
+        return self.Document_Parser(self.objectified_input_xml, **self.options)
@@ -4,10 +4,15 @@ from abc import ABC, abstractmethod
 class Entsoe_Document_Parser(ABC):
     def __init__(self):
         self.objectified_input_xml = None
+        self.options = {}
 
     def set_objectified_input_xml(self, objectified_input_xml):
         self.objectified_input_xml = objectified_input_xml
 
+    def set_options(self, **options):
+        """Keyword arguments of the `Document_Parser`, e.g. `float_dtype`."""
+        self.options = options
+
     @classmethod
     @abstractmethod
     def parse(cls):
@@ -0,0 +1,99 @@
+"""
+Streaming parser for documents of the standard `root` -> `TimeSeries` -> `Period` -> `Point` form,
+i.e. `GL_MarketDocument`, `Publication_MarketDocument`, `Balancing_MarketDocument` and
+`TransmissionNetwork_MarketDocument`.
+
+`lxml.etree.iterparse` hands over each `Period` as soon as it is complete.
+Its `Points` are appended to a `ParserUtils.ColumnBuilder` and the `Period` is removed
+from the tree, hence at most one `Period` is held in memory besides the columns.
+The resulting DataFrame equals the one of the document's objectify parser.
+"""
+from io import BytesIO
+from typing import IO, Union
+
+import numpy as np
+import pandas as pd
+from lxml import etree
+
+from entsoe_client.Parsers import ParserUtils as utils
+from entsoe_client.Parsers import Sinks
+from entsoe_client.Parsers.Balacing_MarketDocument_Parser import \
+    Balancing_MarketDocument_Parser
+from entsoe_client.Parsers.GL_MarketDocument_Parser import \
+    GL_MarketDocument_Parser
+from entsoe_client.Parsers.Publication_MarketDocument_Parser import \
+    Publication_MarketDocument_Parser
+from entsoe_client.Parsers.TransmissionNetwork_MarketDocument_Parser import \
+    TransmissionNetwork_MarketDocument_Parser
+
+# Document parsers whose output `IterParser` reproduces.
+STANDARD_PARSERS = (
+    GL_MarketDocument_Parser,
+    Publication_MarketDocument_Parser,
+    Balancing_MarketDocument_Parser,
+    TransmissionNetwork_MarketDocument_Parser,
+)
+
+
+class UnsupportedDocument(Exception):
+    """The document has to be parsed by its objectify parser."""
+    pass
+
+
+class IterParser:
+    def __init__(
+        self,
+        factory,
+        float_dtype=np.float64,
+        categorical: bool = True,
+        normalized: bool = False,
+        sink: Union[str, Sinks.Sink] = "pandas",
+    ):
+        self.factory = factory
+        self.float_dtype = float_dtype
+        self.categorical = categorical
+        self.normalized = normalized
+        self.sink = sink
+
+    def check_document(self, root: etree._Element) -> None:
+        tag = utils.localname(root.tag)
+        document_type = next(
+            (child.text for child in root if utils.localname(child.tag) == "type"), None
+        )
+        if document_type is None:  # Query error, see `XMLParser.deserialize_xml`.
+            raise UnsupportedDocument(tag)
+        parser = self.factory.get_parser(tag, document_type)
+        if type(parser) not in STANDARD_PARSERS:
+            raise UnsupportedDocument(tag, document_type)
+
+    def parse(self, xml_document: Union[bytes, IO[bytes]]) -> Union[pd.DataFrame, utils.Tables]:
+        if isinstance(xml_document, bytes):
+            xml_document = BytesIO(xml_document)
+        builder = (utils.TablesBuilder if self.normalized else utils.ColumnBuilder)(
+            float_dtype=self.float_dtype, categorical=self.categorical, sink=self.sink
+        )
+        root = None
+        context = etree.iterparse(
+            xml_document, events=("end",), tag=("{*}Period", "{*}TimeSeries")
+        )
+        for _, elem in context:
+            if utils.localname(elem.tag) == "Period":
+                if root is None:
+                    root = elem.getparent().getparent()
+                    self.check_document(root)
+                builder.append_Period(*utils.parse_Period(elem))
+            else:
+                # Periods are removed once parsed, the remaining children are metadata.
+                builder.end_TimeSeries(
+                    utils.unfold_metadata(
+                        utils.other_child_elements(elem, tag="Period"), "TimeSeries"
+                    )
+                )
+            elem.getparent().remove(elem)
+        if root is None:
+            raise UnsupportedDocument("No Period.")
+        return builder.to_frame(
+            utils.unfold_metadata(
+                utils.other_child_elements(root, tag="TimeSeries"), utils.localname(root.tag)
+            )
+        )
@@ -1,6 +1,5 @@
 from entsoe_client.Parsers import ParserUtils as utils
 from entsoe_client.Parsers.Entsoe_Document_Parser import Entsoe_Document_Parser
-import pandas as pd
 
 
 class Abstract_Outages_MarketDocument_Parser(Entsoe_Document_Parser):
@@ -40,8 +39,8 @@ class Outages_MarketDocument_Parser(Abstract_Outages_MarketDocument_Parser):
         self.set_Document_Parser(utils.StandardOutagesTransmissionParser)
 
     def parse(self):
-        lst = [self.Document_Parser(elem) for elem in self.objectified_input_xml]
-        df = pd.concat(lst)
+        """`objectified_input_xml` is one document or an iterable of documents."""
+        df = self.Document_Parser(self.objectified_input_xml, **self.options)
         return df
 
 
@@ -1,11 +1,17 @@
+import copy
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
-from typing import List
-from zipfile import ZipFile
+from itertools import groupby, repeat
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Union
+from zipfile import ZIP_DEFLATED, ZipFile
 
 import pandas as pd
 import requests
 from lxml import etree, objectify
 
+from entsoe_client.Parsers import ParserUtils as utils
 from entsoe_client.Parsers.Balacing_MarketDocument_Parser import (
     Balancing_MarketDocument_FinancialExpensesAndIncomeForBalancing_Parser,
     Balancing_MarketDocument_Parser)
@@ -19,56 +25,279 @@ from entsoe_client.Parsers.Acknowledgment_MarketDocument_Parser import \
     Acknowledgment_MarketDocument_Parser
 from entsoe_client.Parsers.Outages_MarketDocument_Parser import \
     Outages_MarketDocument_Parser
+from entsoe_client.Parsers.IterParser import IterParser, UnsupportedDocument
+
+ENGINES = ("objectify", "iterparse")
+OUTAGE_TAG = "Unavailability_MarketDocument"
 
 
 class Parser:
     @staticmethod
-    def parse(response: requests.Response):
+    def get_content(response: requests.Response) -> Union[bytes, IO[bytes]]:
+        """The spooled file of a streamed download, else the response body."""
+        fileobj = getattr(response, "fileobj", None)
+        if fileobj is None:
+            return response.content
+        fileobj.seek(0)
+        return fileobj
+
+    @staticmethod
+    def parse(
+        response: requests.Response,
+        engine: str = "objectify",
+        workers: Optional[int] = 1,
+        **options,
+    ):
+        """
+        `engine="iterparse"` streams XML documents of the standard
+        `TimeSeries` -> `Period` -> `Point` form, see `IterParser`.
+        Other documents are parsed by objectify in either case.
+        `workers` processes parse the members of ZIP archives, see `ZipParser`.
+
+        `options` are passed to the document parser:
+        `float_dtype`, e.g. `np.float32`, of numeric Point values; default float64.
+        `categorical=False` returns metadata as strings instead of `pd.Categorical`.
+        `normalized=True` returns `ParserUtils.Tables` of series metadata and Point values
+        instead of one DataFrame; acknowledgements remain DataFrames.
+        Outages add the table `assets` of their `Asset_RegisteredResources`.
+        `sink="pyarrow"` or `sink="polars"` returns `pyarrow.Table` or `polars.DataFrame`
+        with the timestamps in column `timestamp`, see `Sinks`.
+        `intervals=True` returns outages as one row per availability segment with its
+        start, `end` and `quantity` instead of one row per Point; other documents reject it.
+        """
         response_type = response.headers["Content-Type"]
-        content = response.content
+        content = Parser.get_content(response)
         if (response_type == "text/xml") or (response_type == "application/xml"):
-            parser = XMLParser()
+            parser = XMLParser(engine=engine, **options)
         elif response_type == "application/zip":
-            parser = ZipParser()
+            parser = ZipParser(engine=engine, workers=workers, **options)
         else:
             raise NotImplementedError
         df = parser.parse(content)
         return df
 
+    @staticmethod
+    def count_documents(response: requests.Response) -> int:
+        response_type = response.headers["Content-Type"]
+        if (response_type == "text/xml") or (response_type == "application/xml"):
+            return XMLParser.count_documents(response.content)
+        elif response_type == "application/zip":
+            return ZipParser.count_documents(response.content)
+        else:
+            raise NotImplementedError
+
+    @staticmethod
+    def merge(responses: List[requests.Response]) -> requests.Response:
+        """Merges responses of the same type, e.g. pages of one query, into one response."""
+        response_type = responses[0].headers["Content-Type"]
+        if len(responses) == 1:
+            return responses[0]
+        contents = [response.content for response in responses]
+        if (response_type == "text/xml") or (response_type == "application/xml"):
+            content = XMLParser.merge_documents(contents)
+        elif response_type == "application/zip":
+            content = ZipParser.merge_archives(contents)
+        else:
+            raise NotImplementedError
+        merged_response = copy.copy(responses[0])
+        merged_response._content = content
+        return merged_response
+
+    @staticmethod
+    def parse_many(
+        responses: Iterable[requests.Response], engine: str = "objectify", **options
+    ) -> pd.DataFrame:
+        """
+        Parses responses to consecutive queries into one DataFrame without duplicate rows.
+        Acknowledgements, i.e. responses without data, are dropped unless no response has data.
+        """
+        dfs = [Parser.parse(response, engine=engine, **options) for response in responses]
+        data_dfs = [df for df in dfs if not Parser.is_acknowledgement(df)]
+        if not data_dfs:
+            return dfs[0]
+        if len(data_dfs) == 1:
+            return data_dfs[0]
+        df = utils.concat_documents(data_dfs)
+        if isinstance(df, utils.Tables):
+            return utils.drop_duplicate_tables(df)
+        return utils.drop_duplicate_records(df)
+
+    @staticmethod
+    def is_acknowledgement(df: Union[pd.DataFrame, utils.Tables]) -> bool:
+        return isinstance(df, pd.DataFrame) and df.attrs.get("acknowledgement", False)
+
     def __call__(self, response: requests.Response):
         return self.parse(response)
 
 
+def parse_members(xml_documents: Iterable[bytes], engine: str, options: Dict):
+    """
+    Parses consecutive archive members into one frame; module-level to run in worker processes.
+    Runs of outage documents, one per outage, are parsed into a single frame by
+    `Outages_MarketDocument_Parser`, one tree at a time. Other members are parsed
+    one by one and concatenated.
+    """
+    parser = XMLParser(engine=engine, **options)
+    dfs = []
+    for is_outage, members in groupby(
+        xml_documents, key=lambda xml_document: XMLParser.root_tag(xml_document) == OUTAGE_TAG
+    ):
+        if is_outage:
+            outages = Outages_MarketDocument_Parser()
+            outages.set_objectified_input_xml(map(XMLParser.deserialize_xml, members))
+            outages.set_options(**options)
+            dfs.append(outages.parse())
+        else:
+            dfs.extend(map(parser.parse, members))
+    return utils.concat_documents(dfs)
+
+
 class ZipParser:
+    """
+    Archives hold one XML document per member, e.g. per outage. Members are parsed
+    in member order, see `parse_members`, and concatenated.
+
+    With `workers` > 1, members are parsed in a process pool, as deserialization
+    is CPU-bound; `None` uses all CPUs. Each task parses a batch of consecutive members
+    and returns a single frame, hence few columnar frames are pickled back instead of
+    one per member. Workers are spawned, not forked, as the parent may run threads.
+    """
+
+    def __init__(self, engine: str = "objectify", workers: Optional[int] = 1, **options):
+        if engine not in ENGINES:
+            raise ValueError(engine)
+        self.engine = engine
+        self.workers = workers
+        self.options = options
+
+    @staticmethod
+    def open_archive(response_content: Union[bytes, IO[bytes]]) -> ZipFile:
+        if isinstance(response_content, bytes):
+            response_content = BytesIO(response_content)
+        return ZipFile(response_content, "r")
+
     @staticmethod
-    def unpack_archive(response_content: bytes) -> List[bytes]:
-        archive = ZipFile(BytesIO(response_content), "r")
-        xml_document_list = [archive.read(file) for file in archive.infolist()]
+    def unpack_archive(response_content: Union[bytes, IO[bytes]]) -> List[bytes]:
+        with ZipParser.open_archive(response_content) as archive:
+            xml_document_list = [archive.read(file) for file in archive.infolist()]
         return xml_document_list
 
-    def parse(self, zip_archive: bytes):
-        xml_documents = self.unpack_archive(zip_archive)
-        deserailized_xmls = [XMLParser.deserialize_xml(elem) for elem in xml_documents]
-        parser = factory.get_parser(deserailized_xmls[0].tag, deserailized_xmls[0].type.text)
-        parser.set_objectified_input_xml(deserailized_xmls)
-        return parser.parse()
+    @staticmethod
+    def count_documents(response_content: bytes) -> int:
+        with ZipFile(BytesIO(response_content), "r") as archive:
+            return len(archive.infolist())
+
+    @staticmethod
+    def merge_archives(response_contents: List[bytes]) -> bytes:
+        """Copies all members into one archive; repeated member names are suffixed."""
+        buffer = BytesIO()
+        names = set()
+        with ZipFile(buffer, "w", ZIP_DEFLATED) as merged_archive:
+            for response_content in response_contents:
+                with ZipFile(BytesIO(response_content), "r") as archive:
+                    for info in archive.infolist():
+                        name, i = info.filename, 1
+                        while name in names:
+                            name, i = f"{i}_{info.filename}", i + 1
+                        names.add(name)
+                        merged_archive.writestr(name, archive.read(info))
+        return buffer.getvalue()
+
+    def _iter_parse(self, archive: ZipFile) -> Iterator:
+        parser = XMLParser(engine=self.engine, **self.options)
+        for member in archive.infolist():
+            # Decompressed from the archive while parsing, the member is never held as bytes.
+            with archive.open(member) as xml_document:
+                yield parser.parse(xml_document)
+
+    def iter_parse(self, zip_archive: Union[bytes, IO[bytes]]) -> Iterator:
+        """
+        Yields the parsed frame of each member in member order.
+        Only one member's tree is alive at a time, hence archives of thousands of
+        documents are processed in memory bounded by the largest member and the
+        frames kept by the caller. Ignores `workers`.
+        """
+        with self.open_archive(zip_archive) as archive:
+            yield from self._iter_parse(archive)
+
+    def parse(self, zip_archive: Union[bytes, IO[bytes]]):
+        with self.open_archive(zip_archive) as archive:
+            members = archive.infolist()
+            if self.workers == 1 or len(members) < 2:
+                xml_documents = (archive.read(member) for member in members)
+                return parse_members(xml_documents, self.engine, self.options)
+            else:
+                workers = self.workers or os.cpu_count() or 1
+                size = -(-len(members) // (4 * workers))
+                batches = (
+                    [archive.read(member) for member in members[i : i + size]]
+                    for i in range(0, len(members), size)
+                )
+                # Forking a process whose thread pools run, e.g. polars', deadlocks the children.
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(workers, mp_context=context) as executor:
+                    dfs = list(executor.map(
+                        parse_members, batches, repeat(self.engine), repeat(self.options)
+                    ))
+        return utils.concat_documents(dfs)
 
 
 class XMLParser:
+    def __init__(self, engine: str = "objectify", **options):
+        if engine not in ENGINES:
+            raise ValueError(engine)
+        self.engine = engine
+        self.options = options
+
     @staticmethod
-    def deserialize_xml(response_content: bytes) -> objectify.ObjectifiedElement:
-        objectified_xml = objectify.fromstring(response_content)
-        for elem in objectified_xml.getiterator():
-            elem.tag = etree.QName(elem).localname
-        etree.cleanup_namespaces(objectified_xml)
-        if objectified_xml.find("type") is None:  # happens when a query is not fulfilled
+    def deserialize_xml(
+        response_content: Union[bytes, IO[bytes]]
+    ) -> objectify.ObjectifiedElement:
+        if isinstance(response_content, bytes):
+            objectified_xml = objectify.fromstring(response_content)
+        else:
+            objectified_xml = objectify.parse(response_content).getroot()
+        if objectified_xml.find("{*}type") is None:  # happens when a query is not fulfilled
             objectified_xml["type"] = "Query error"
         return objectified_xml
 
-    def parse(self, xml_document: bytes):
+    @staticmethod
+    def root_tag(xml_document: bytes) -> str:
+        """Local name of the root element, read without parsing the document."""
+        _, root = next(etree.iterparse(BytesIO(xml_document), events=("start",)))
+        return utils.localname(root.tag)
+
+    @staticmethod
+    def count_documents(response_content: bytes) -> int:
+        """Number of TimeSeries; acknowledgements count as empty."""
+        root = etree.fromstring(response_content)
+        if etree.QName(root).localname == "Acknowledgement_MarketDocument":
+            return 0
+        return len(root.findall("TimeSeries", root.nsmap))
+
+    @staticmethod
+    def merge_documents(response_contents: List[bytes]) -> bytes:
+        """Appends the TimeSeries of all documents to the first document."""
+        root = etree.fromstring(response_contents[0])
+        for response_content in response_contents[1:]:
+            other_root = etree.fromstring(response_content)
+            for time_series in other_root.findall("TimeSeries", other_root.nsmap):
+                root.append(time_series)
+        return etree.tostring(root, xml_declaration=True, encoding="UTF-8")
+
+    def parse(self, xml_document: Union[bytes, IO[bytes]]):
+        if self.engine == "iterparse":
+            try:
+                return IterParser(factory, **self.options).parse(xml_document)
+            except UnsupportedDocument:
+                if not isinstance(xml_document, bytes):
+                    xml_document.seek(0)
         object_content = self.deserialize_xml(xml_document)
-        parser = factory.get_parser(object_content.tag, object_content.type.text)
+        parser = factory.get_parser(
+            utils.localname(object_content.tag), object_content.type.text
+        )
         parser.set_objectified_input_xml(object_content)
+        parser.set_options(**self.options)
         return parser.parse()
 
 
@@ -77,7 +306,7 @@ class ParserFactory:
     def get_parser(tag: str, document_type: str):
         if tag in ["Acknowledgement_MarketDocument"]:
             return Acknowledgment_MarketDocument_Parser()
-        elif tag in ["Unavailability_MarketDocument"]:
+        elif tag in [OUTAGE_TAG]:
             return Outages_MarketDocument_Parser()
         elif tag in ["GL_MarketDocument"]:
             if document_type in ["A65", "A70"]:  # Load
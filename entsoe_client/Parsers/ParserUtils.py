@@ -9,12 +9,33 @@ such as varying `Business Type` across TimeSeries'.
 The root node holds meta-data on the global parameters of the query.
 
 A minimal, trivial parser would purely unroll such structure recursively.
+
+Trees keep their namespaces. Tags are compared by their local name, see `localname`.
+Nodes are selected through precompiled XPaths on `local-name()`, e.g. `child_elements`,
+or by walking a node's children once, see `walk_outage`.
 """
-from typing import Callable, Dict, List, Any
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Union
 
+import numpy as np
 import pandas as pd
 from lxml import etree
 
+from entsoe_client.Parsers import Sinks
+
+
+def localname(tag: str, _cache: Dict[str, str] = {}) -> str:
+    """`{namespace}tag` -> `tag`, memoized as documents repeat few tags."""
+    try:
+        return _cache[tag]
+    except KeyError:
+        return _cache.setdefault(tag, tag.rpartition("}")[2])
+
+
+# Child elements by local name; comments are skipped.
+child_elements = etree.XPath("./*[local-name()=$tag]")
+other_child_elements = etree.XPath("./*[local-name()!=$tag]")
+
 
 def unfold_node(
         node: etree._Element,
@@ -23,7 +44,7 @@ def unfold_node(
     Recursive unfolding of a node into a dict.
     TODO: Ensure no overwriting of same dict-names in the unfolding.
     """
-    tag: str = node.tag
+    tag: str = localname(node.tag)
     children: etree._Element = node.getchildren()
     if not children:
         return tag, node.text
@@ -35,14 +56,12 @@ def decompose_node(node: etree._Element, subnode_tag) -> tuple[dict, list]:
     """node -> [subnodes], {metadata}"""
     if not subnode_tag:
         data_nodes: list = node.xpath(f"./*")
-        data: dict = {node.tag.partition("}")[2]: dict(map(unfold_node, data_nodes))}
+        data: dict = {localname(node.tag): dict(map(unfold_node, data_nodes))}
         return {}, [data]
     if isinstance(subnode_tag, str):
-        subnodes: list = node.findall(f"./{subnode_tag}", node.nsmap)
-        metadata_nodes: list = node.xpath(
-            f"./*[not(self::{subnode_tag})]", namespaces=node.nsmap
-        )
-        metadata: dict = {node.tag: dict(map(unfold_node, metadata_nodes))}
+        subnodes: list = child_elements(node, tag=subnode_tag)
+        metadata_nodes: list = other_child_elements(node, tag=subnode_tag)
+        metadata: dict = {localname(node.tag): dict(map(unfold_node, metadata_nodes))}
         return metadata, subnodes
     if isinstance(subnode_tag, list):
         # Handle multiple subnode types.
@@ -65,7 +84,7 @@ class Tree_to_DataFrame:
 
 def Root_to_DataFrame_fn() -> Callable:
     def Root_to_DataFrame(Root: etree._Element) -> pd.DataFrame:
-        data = [(elem.tag, elem.text) for elem in Root.getiterator()]
+        data = [(localname(elem.tag), elem.text) for elem in Root.iter(etree.Element)]
         return pd.DataFrame(data, columns=['Tag', 'Value'])
 
     return Root_to_DataFrame
@@ -82,10 +101,8 @@ def Period_to_DataFrame_fn(get_Period_data: Callable) -> Callable:
         assert len(data) == len(index)
         df = pd.DataFrame(data=data, index=index)
 
-        metadata_nodes: list = Period.xpath(
-            f"./*[not(self::Point)]", namespaces=Period.nsmap
-        )
-        metadata: dict = {Period.tag: dict(map(unfold_node, metadata_nodes))}
+        metadata_nodes: list = other_child_elements(Period, tag="Point")
+        metadata: dict = {localname(Period.tag): dict(map(unfold_node, metadata_nodes))}
         meta_dict = pd.json_normalize(metadata).iloc[0].to_dict()
         df = df.assign(**meta_dict)
 
@@ -98,9 +115,35 @@ def get_Period_index(Period: etree._Element) -> pd.Index:
     start = Period.timeInterval.start.text
     end = Period.timeInterval.end.text
     resolution = Period.resolution.text
-    index = pd.date_range(start, end, freq=resolution_map[resolution])
-    index = index[:-1] if index.size > 1 else index
-    return index
+    return Period_index(start, end, resolution)
+
+
+def Period_index(start: str, end: str, resolution: str) -> pd.Index:
+    timestamps = Period_timestamps(start, end, resolution)
+    return pd.DatetimeIndex(timestamps.view("datetime64[ns]")).tz_localize("UTC")
+
+
+@lru_cache(maxsize=1024)
+def Period_timestamps(start: str, end: str, resolution: str) -> np.ndarray:
+    """
+    UTC nanoseconds of the Points of a Period, i.e. `start + k * resolution` for every
+    step ending no later than `end`, and at least `start`.
+    Calendar resolutions add months and years to `start` in UTC.
+    Memoized, as the TimeSeries of a document repeat their Periods; the array is read-only.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    step = resolution_nanoseconds.get(resolution)
+    if step is not None:
+        length = max((end.value - start.value) // step, 1)
+        timestamps = start.value + step * np.arange(length, dtype=np.int64)
+    else:
+        offset = calendar_resolutions[resolution]
+        length = 1
+        while start + (length + 1) * offset <= end:
+            length += 1
+        timestamps = np.array([(start + k * offset).value for k in range(length)], dtype=np.int64)
+    timestamps.flags.writeable = False
+    return timestamps
 
 
 # Maps response_xml resolutions to
@@ -116,45 +159,478 @@ resolution_map: Dict = {
     "PT1M": "1min",
 }
 
+# Resolutions of fixed length, in nanoseconds.
+resolution_nanoseconds: Dict[str, int] = {
+    resolution: pd.Timedelta(freq).value
+    for resolution, freq in resolution_map.items()
+    if resolution not in ("P1M", "P1Y")
+}
+calendar_resolutions: Dict[str, pd.DateOffset] = {
+    "P1M": pd.DateOffset(months=1),
+    "P1Y": pd.DateOffset(years=1),
+}
+
 
 def check_period_data_missing(data: list[Dict[str, str]]) -> List[Dict]:
     """
     Checks for missing data in the data list (missing position from the api response)
+    A missing position repeats the values of the preceding `Point`, as in curveType A03.
+    Runs in linear time; `data` is only sorted if it is not ordered by position.
     """
-    data.sort(key=lambda x: int(x['position']))
-    complete_data = {int(pos['position']): pos['quantity'] for pos in data}
-    for position in range(1, max(complete_data) + 1):
-        if position not in complete_data:
-            prev_position = max(filter(lambda x: x < position, complete_data), default=0)
-            data.append({'position': str(position), 'quantity': complete_data[prev_position]})
-    data.sort(key=lambda x: int(x['position']))
-    return data
+    positions = [int(datum['position']) for datum in data]
+    if any(a > b for a, b in zip(positions, positions[1:])):
+        order = sorted(range(len(data)), key=positions.__getitem__)
+        data = [data[i] for i in order]
+        positions = [positions[i] for i in order]
+    complete_data = []
+    expected = 1
+    for position, datum in zip(positions, data):
+        previous = complete_data[-1] if complete_data else {}
+        complete_data.extend(
+            {**previous, 'position': str(missing)} for missing in range(expected, position)
+        )
+        complete_data.append(datum)
+        expected = max(expected, position + 1)
+    return complete_data
 
 
 def get_Period_data(Period: etree._Element,
                     length: int) -> List[Dict]:
-    points = Period.xpath("./Point", namespaces=Period.nsmap)
+    points = Period.iterchildren("{*}Point")
     data = [
-        dict([(datum.tag, datum.text) for datum in point.iterchildren()])
+        {localname(datum.tag): datum.text for datum in point.iterchildren(etree.Element)}
         for point in points
     ]
+    return fill_Period_data(data, length)
+
+
+def fill_Period_data(data: List[Dict], length: int) -> List[Dict]:
     data = check_period_data_missing(data=data)
     # check for missing positions if the length of the index is longer that the data (and no position is missing
     # inside the data list)
-    if length != len(data):
-        data += [{'position': str(i + 1), 'quantity': data[-1]['quantity']} for i in range(length - len(data))]
+    if data and length > len(data):
+        data += [{**data[-1], 'position': str(i + 1)} for i in range(len(data), length)]
     return data
 
 
-def get_Period_Financial_Price_data(Period: etree._Element) -> List[Dict]:
+def fill_Period_columns(columns: Dict[str, np.ndarray], length: int) -> Dict[str, np.ndarray]:
+    """
+    `fill_Period_data` on arrays: every position in 1..`length` takes the values
+    of the last `Point` at or before it, found by binary search over the sorted positions.
+    """
+    positions = columns["position"].astype(np.int64)
+    order = np.argsort(positions, kind="stable")
+    positions = positions[order]
+    assert positions.size and positions[-1] <= length
+    source = np.searchsorted(positions, np.arange(1, length + 1), side="right") - 1
+    missing = source < 0
+    filled = {"position": position_values(length)}
+    for field, values in columns.items():
+        if field == "position":
+            continue
+        values = values[order][source]
+        values[missing] = np.nan
+        filled[field] = values
+    return filled
+
+
+def flatten(prefix: str, value, flat: Dict) -> Dict:
+    """Dotted column names as produced by `pd.json_normalize`."""
+    if isinstance(value, dict):
+        for key, sub_value in value.items():
+            flatten(f"{prefix}.{key}", sub_value, flat)
+    else:
+        flat[prefix] = value
+    return flat
+
+
+def unfold_metadata(nodes: List[etree._Element], prefix: str) -> Dict:
+    return flatten(prefix, dict(map(unfold_node, nodes)), {})
+
+
+def extend_order(order: List[str], columns) -> None:
+    """Ordered union, i.e. the column order of `pd.concat`."""
+    known = set(order)
+    for column in columns:
+        if column not in known:
+            known.add(column)
+            order.append(column)
+
+
+point_count = etree.XPath("count(./*[local-name()='Point'])")
+point_values = etree.XPath(
+    "./*[local-name()='Point']/*[local-name()=$tag]/text()", smart_strings=False
+)
+
+
+@lru_cache(maxsize=32)
+def position_values(length: int) -> np.ndarray:
+    return np.array([str(position) for position in range(1, length + 1)], dtype=object)
+
+
+def records_to_columns(records: List[Dict]) -> Dict[str, np.ndarray]:
+    fields: List[str] = []
+    extend_order(fields, (field for record in records for field in record))
+    return {
+        field: np.array([record.get(field, np.nan) for record in records], dtype=object)
+        for field in fields
+    }
+
+
+def get_Period_columns(Period: etree._Element, length: int) -> Dict[str, np.ndarray]:
+    """
+    `get_Period_data` by column: one XPath per field of the first `Point`.
+    Gaps are filled by `fill_Period_columns`. Periods whose `Points` have
+    differing fields go through `get_Period_data`.
+    """
+    point = Period.find("{*}Point")
+    if point is not None:
+        points = point_count(Period)
+        fields = [localname(datum.tag) for datum in point.iterchildren(etree.Element)]
+        columns = {
+            field: np.array(point_values(Period, tag=field), dtype=object)
+            for field in fields
+        }
+        if "position" in columns and all(values.size == points for values in columns.values()):
+            if points == length and np.array_equal(columns["position"], position_values(length)):
+                return columns
+            return fill_Period_columns(columns, length)
+    return records_to_columns(get_Period_data(Period, length))
+
+
+# Metadata parsed into UTC datetimes, by the last component of the column name.
+TIMESTAMP_FIELDS = ("start", "end", "createdDateTime")
+NAT = np.datetime64("NaT", "ns")
+
+
+def is_timestamp_field(name: str) -> bool:
+    return name.rpartition(".")[2] in TIMESTAMP_FIELDS
+
+
+def to_datetime64(value) -> np.datetime64:
+    """ISO 8601 string -> naive UTC `datetime64[ns]`."""
+    if value is None:
+        return NAT
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.tz_convert(None)
+    return timestamp.to_datetime64().astype("datetime64[ns]")
+
+
+def typed_metadata(metadata: Dict) -> Dict:
+    return {
+        name: to_datetime64(value) if is_timestamp_field(name) else value
+        for (name, value) in metadata.items()
+    }
+
+
+def typed_values(name: str, values: np.ndarray, float_dtype=np.float64) -> np.ndarray:
+    """Point values as integer `position`, as `float_dtype` if numeric, else unchanged."""
+    if values.dtype != object:  # Already typed, e.g. `series_id`.
+        return values
+    try:
+        return values.astype(np.int64 if name == "position" else float_dtype)
+    except (TypeError, ValueError):
+        return values
+
+
+class ColumnBuilder:
+    """
+    Columns of one document's DataFrame, filled Period by Period.
+
+    Arrays are preallocated for `capacity` rows and grow when a streamed document exceeds it.
+    Cells of columns missing in a Period are NaN. Column order and metadata broadcasting
+    follow `Tree_to_DataFrame(Tree_to_DataFrame(Period_to_DataFrame_fn(...)))`.
+
+    Point values are stored typed, see `typed_values`: `position` as int64, numeric
+    fields as `float_dtype`. Timestamp metadata becomes UTC datetimes.
+    With `categorical`, other metadata is stored as int32 codes into the column's
+    distinct values and returned as `pd.Categorical`, instead of a string per row.
+    The columns are handed to `sink` as `Sinks.Records`.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 0,
+        float_dtype=np.float64,
+        categorical: bool = True,
+        sink: Union[str, Sinks.Sink] = "pandas",
+    ):
+        self.capacity = capacity
+        self.float_dtype = float_dtype
+        self.categorical = categorical
+        self.sink = Sinks.get_sink(sink)
+        self.length = 0
+        self.data: Dict[str, np.ndarray] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        self.categories: Dict[str, Dict[str, int]] = {}
+        self.timestamps = np.zeros(capacity, dtype=np.int64)  # UTC nanoseconds.
+        self.order: List[str] = []
+        self.TimeSeries_order: List[str] = []
+        self.TimeSeries_start = 0
+
+    @staticmethod
+    def empty(size: int, dtype) -> np.ndarray:
+        if dtype.kind == "M":
+            return np.full(size, NAT, dtype=dtype)
+        if dtype.kind == "i":  # Integers have no NaN, rows not written yet are 0.
+            return np.zeros(size, dtype=dtype)
+        return np.full(size, np.nan, dtype=dtype)
+
+    def column(self, name: str, dtype, start: int = 0) -> np.ndarray:
+        """Column `name`, allocated or cast such that it holds values of `dtype` from row `start`."""
+        values = self.data.get(name)
+        if values is None:
+            if dtype.kind == "i" and start > 0:
+                dtype = np.dtype(np.float64)  # Earlier rows are missing.
+            values = self.data[name] = self.empty(self.capacity, dtype)
+        elif values.dtype != dtype and not np.can_cast(dtype, values.dtype):
+            try:
+                common = np.result_type(values.dtype, dtype)
+            except TypeError:
+                common = np.dtype(object)
+            values = self.data[name] = values.astype(common)
+        return values
+
+    def reserve(self, size: int) -> None:
+        if self.length + size <= self.capacity:
+            return
+        self.capacity = max(self.length + size, 2 * self.capacity)
+        for name, values in self.data.items():
+            grown = self.empty(self.capacity, values.dtype)
+            grown[: self.length] = values[: self.length]
+            self.data[name] = grown
+        timestamps = np.zeros(self.capacity, dtype=np.int64)
+        timestamps[: self.length] = self.timestamps[: self.length]
+        self.timestamps = timestamps
+        for name, codes in self.codes.items():
+            grown = np.full(self.capacity, -1, dtype=np.int32)
+            grown[: self.length] = codes[: self.length]
+            self.codes[name] = grown
+
+    def code(self, name: str, value) -> int:
+        """Code of `value` among the categories of column `name`; -1 for missing values."""
+        if name not in self.codes:
+            self.codes[name] = np.full(self.capacity, -1, dtype=np.int32)
+            self.categories[name] = {}
+        if value is None:
+            return -1
+        categories = self.categories[name]
+        return categories.setdefault(value, len(categories))
+
+    def assign(self, metadata: Dict, start: int = 0) -> None:
+        for name, value in typed_metadata(metadata).items():
+            if isinstance(value, np.datetime64):
+                self.column(name, value.dtype)[start : self.length] = value
+            elif self.categorical and name not in self.data:
+                code = self.code(name, value)
+                self.codes[name][start : self.length] = code
+            else:
+                self.column(name, np.dtype(object))[start : self.length] = value
+
+    def append_Period(self, index, columns: Dict[str, np.ndarray], metadata: Dict) -> None:
+        """`index` holds the Points' timestamps as UTC `pd.DatetimeIndex` or int64 nanoseconds."""
+        if isinstance(index, pd.DatetimeIndex):
+            index = index.asi8
+        self.reserve(len(index))
+        start, self.length = self.length, self.length + len(index)
+        self.timestamps[start : self.length] = index
+        for name, values in columns.items():
+            values = typed_values(name, values, self.float_dtype)
+            self.column(name, values.dtype, start)[start : self.length] = values
+        for name, values in self.data.items():
+            if values.dtype.kind == "i" and name not in columns:
+                values = self.data[name] = values.astype(np.float64)
+                values[start : self.length] = np.nan
+        self.assign(metadata, start=start)
+        extend_order(self.TimeSeries_order, columns)
+        extend_order(self.TimeSeries_order, metadata)
+
+    def end_TimeSeries(self, metadata: Dict) -> None:
+        if self.length > self.TimeSeries_start:
+            self.assign(metadata, start=self.TimeSeries_start)
+            extend_order(self.TimeSeries_order, metadata)
+            extend_order(self.order, self.TimeSeries_order)
+        self.TimeSeries_order, self.TimeSeries_start = [], self.length
+
+    def to_records(self, metadata: Dict) -> Sinks.Records:
+        """Broadcasts the document `metadata` and returns the columns."""
+        if not self.length:
+            raise ValueError("Document without Period.")
+        self.assign(metadata)
+        order = list(self.order)
+        extend_order(order, metadata)
+        index = pd.DatetimeIndex(self.timestamps[: self.length].view("datetime64[ns]")).tz_localize("UTC")
+        columns = {}
+        for name in order:
+            if name in self.codes:
+                columns[name] = Sinks.Categories(
+                    self.codes[name][: self.length], list(self.categories[name])
+                )
+            else:
+                columns[name] = self.data[name][: self.length]
+        return Sinks.Records(index, columns)
+
+    def to_frame(self, metadata: Dict):
+        """DataFrame of `sink`, by default `pd.DataFrame`."""
+        return self.sink.from_records(self.to_records(metadata))
+
+
+class Tables(NamedTuple):
+    """
+    Normalized output: `series` holds one row of flattened metadata per Period,
+    indexed by `series_id`; `values` holds the `series_id`, `timestamp` and
+    Point values of each Point. Outages have `assets`, the distinct
+    `Asset_RegisteredResources` of each outage by `series_id`, see `asset_frame`.
+    """
+    series: pd.DataFrame
+    values: pd.DataFrame
+    assets: pd.DataFrame = None
+
+    def copy(self) -> "Tables":
+        return Tables(*(None if table is None else copy_frame(table) for table in self))
+
+
+def copy_frame(df):
+    """Copy of a parsed frame or `Tables` for another caller, see `Sinks.Sink.copy`."""
+    if isinstance(df, Tables):
+        return df.copy()
+    return Sinks.sink_of(df).copy(df)
+
+
+def series_frame(records: List[Dict]) -> pd.DataFrame:
+    series = pd.DataFrame.from_records(records)
+    series.index.name = "series_id"
+    for column in series.columns:
+        if is_timestamp_field(column):
+            series[column] = pd.to_datetime(series[column], utc=True)
+    return series
+
+
+class TablesBuilder:
+    """
+    `ColumnBuilder` counterpart for `Tables`: Point values go into a `ColumnBuilder`
+    next to the Period's `series_id`, metadata is kept once per Period.
+    `to_frame` returns `Tables`.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 0,
+        float_dtype=np.float64,
+        categorical: bool = True,
+        sink: Union[str, Sinks.Sink] = "pandas",
+    ):
+        self.values = ColumnBuilder(capacity, float_dtype=float_dtype, categorical=categorical)
+        self.sink = Sinks.get_sink(sink)
+        self.series: List[Dict] = []
+        self.TimeSeries_start = 0
+
+    def append_Period(self, index: pd.Index, columns: Dict[str, np.ndarray], metadata: Dict) -> None:
+        series_id = np.full(len(index), len(self.series), dtype=np.int32)
+        self.values.append_Period(index, {"series_id": series_id, **columns}, {})
+        self.series.append(dict(metadata))
+
+    def end_TimeSeries(self, metadata: Dict) -> None:
+        self.values.end_TimeSeries({})
+        for record in self.series[self.TimeSeries_start :]:
+            record.update(metadata)
+        self.TimeSeries_start = len(self.series)
+
+    def to_frame(self, metadata: Dict) -> Tables:
+        values = self.values.to_frame({})
+        values.insert(1, "timestamp", values.index)
+        for record in self.series:
+            record.update(metadata)
+        return sink_tables(Tables(series_frame(self.series), values.reset_index(drop=True)), self.sink)
+
+
+def sink_tables(tables: Tables, sink: Sinks.Sink) -> Tables:
+    """pandas `Tables` into frames of `sink`; `series_id` becomes a column."""
+    return Tables(*(None if table is None else sink.from_pandas(table) for table in tables))
+
+
+def pandas_tables(tables: Tables) -> Tables:
+    """Inverse of `sink_tables`."""
+    sink = Sinks.sink_of(tables.values)
+    series = sink.to_pandas(tables.series)
+    if "series_id" in series.columns:
+        series = series.set_index("series_id")
+    assets = None if tables.assets is None else sink.to_pandas(tables.assets)
+    return Tables(series, sink.to_pandas(tables.values), assets)
+
+
+def parse_Period(Period: etree._Element, get_Period_columns: Callable = get_Period_columns):
+    """-> timestamps, see `Period_timestamps`, columns of Point values, Period metadata"""
+    metadata = unfold_metadata(other_child_elements(Period, tag="Point"), localname(Period.tag))
+    index = Period_timestamps(
+        metadata["Period.timeInterval.start"],
+        metadata["Period.timeInterval.end"],
+        metadata["Period.resolution"],
+    )
+    columns = get_Period_columns(Period, length=len(index))
+    return index, columns, metadata
+
+
+class Document_to_DataFrame:
+    """
+    `root` -> `TimeSeries` -> `Period` -> `Point` into one DataFrame.
+
+    Equals `Tree_to_DataFrame(Tree_to_DataFrame(StandardPeriodParser, "Period"), "TimeSeries")`
+    without building a DataFrame per Period and TimeSeries: Point values are copied into
+    arrays preallocated for the whole document and metadata is broadcast into them.
+    With `normalized`, returns `Tables` instead, see `TablesBuilder`.
+    """
+
+    def __init__(self, get_Period_columns: Callable = get_Period_columns):
+        self.get_Period_columns = get_Period_columns
+
+    def __call__(
+        self,
+        root: etree._Element,
+        float_dtype=np.float64,
+        categorical: bool = True,
+        normalized: bool = False,
+        sink: Union[str, Sinks.Sink] = "pandas",
+    ) -> Union[pd.DataFrame, Tables]:
+        TimeSeries_list = [
+            (TimeSeries, [
+                parse_Period(Period, self.get_Period_columns)
+                for Period in child_elements(TimeSeries, tag="Period")
+            ])
+            for TimeSeries in child_elements(root, tag="TimeSeries")
+        ]
+        builder = (TablesBuilder if normalized else ColumnBuilder)(
+            capacity=sum(len(index) for _, Periods in TimeSeries_list for index, _, _ in Periods),
+            float_dtype=float_dtype,
+            categorical=categorical,
+            sink=sink,
+        )
+        for TimeSeries, Periods in TimeSeries_list:
+            for index, columns, metadata in Periods:
+                builder.append_Period(index, columns, metadata)
+            builder.end_TimeSeries(
+                unfold_metadata(other_child_elements(TimeSeries, tag="Period"), "TimeSeries")
+            )
+        metadata = unfold_metadata(
+            other_child_elements(root, tag="TimeSeries"), localname(root.tag)
+        )
+        return builder.to_frame(metadata)
+
+
+def get_Period_Financial_Price_data(Period: etree._Element, length: int = None) -> List[Dict]:
     """
     TODO: Could be abstracted into `get_Period_data.
     """
-    points = Period.xpath("./Point", namespaces=Period.nsmap)
+    points = Period.iterchildren("{*}Point")
     data = [get_Point_Financial_Price_data(point) for point in points]
     return data
 
 
+def get_Period_Financial_Price_columns(Period: etree._Element, length: int) -> Dict[str, np.ndarray]:
+    return records_to_columns(get_Period_Financial_Price_data(Period, length))
+
+
 def get_Point_Financial_Price_data(Point: etree._Element) -> Dict:
     """
     If a `Point` has overlapping `Financial_Price` field,
@@ -164,129 +640,274 @@ def get_Point_Financial_Price_data(Point: etree._Element) -> Dict:
     """
     direction_map = {"A01": "up", "A02": "down", "A03": "up_and_down"}
 
-    datum = {Point.position.tag: Point.position.text}
+    datum = {localname(Point.position.tag): Point.position.text}
     for fp in Point.Financial_Price:
         datum[
-            ".".join([fp.tag, direction_map[fp.direction.text], fp.amount.tag])
+            ".".join(
+                [localname(fp.tag), direction_map[fp.direction.text], localname(fp.amount.tag)]
+            )
         ] = fp.amount.text
 
     return datum
 
 
-def get_index(Period: etree._Element) -> pd.Index:
-    """
-    Get index of the series
-    """
-    points = Period.xpath("unavailability_Time_Period.timeInterval")
-    data = [
-        dict([(datum.tag, datum.text) for datum in point.iterchildren()])
-        for point in points
-    ][0]
-    start = data['start']
-    end = data['end']
-    resolution = Period.xpath("./TimeSeries/Available_Period/resolution")
-    index = pd.date_range(start, end, freq=resolution_map[resolution[0]])
-    index = index[:-1] if index.size > 1 else index
-    return index
+def text_children(node: etree._Element, prefix: str) -> Dict:
+    return {f"{prefix}{localname(datum.tag)}": datum.text for datum in node.iterchildren(etree.Element)}
+
 
+class Outage(NamedTuple):
+    """Fields of an `Unavailability_MarketDocument`, see `walk_outage`."""
+    document: Dict
+    interval: Dict
+    periods: List[Dict]
+    assets: List[Dict]
+    metadata: Dict
 
-def get_data(Period: etree._Element) -> tuple[pd.DatetimeIndex, list[dict[Any, Any]]]:
+
+def walk_outage(document: etree._Element) -> Outage:
     """
-    Get the data of the series
+    Walks an `Unavailability_MarketDocument` once.
+    `document` holds the document's `mRID` and `revisionNumber`, `periods` each
+    `Available_Period`'s `start`, `end`, `resolution` and `points`, `assets` the fields of
+    the `Asset_RegisteredResources` of all TimeSeries. Metadata are the fields of the first
+    TimeSeries and the document's `Reason`.
     """
-    index = get_index(Period=Period)
-    points = Period.xpath("./TimeSeries/Available_Period/Point")
-    data = [
-        dict([(datum.tag, datum.text) for datum in point.iterchildren()])
-        for point in points
-    ]
-    new_ind = []
-    for elem in data:
-        new_ind.append(index[int(elem['position']) - 1])
-    new_ind = pd.DatetimeIndex(new_ind)
-
-    return new_ind, data
+    fields, interval, reason = {}, {}, None
+    periods: List[Dict] = []
+    assets: List[Dict] = []
+    infos: Dict = None
+    for child in document.iterchildren(etree.Element):
+        tag = localname(child.tag)
+        if tag == "unavailability_Time_Period.timeInterval":
+            interval = text_children(child, "")
+        elif tag == "Reason" and reason is None:
+            reason = text_children(child, "Reason.")
+        elif tag == "TimeSeries":
+            first = infos is None
+            if first:
+                infos = {}
+            for node in child.iterchildren(etree.Element):
+                node_tag = localname(node.tag)
+                if node_tag == "Asset_RegisteredResource":
+                    assets.append(text_children(node, ""))
+                elif node_tag == "Available_Period":
+                    period = {"points": []}
+                    for period_node in node.iterchildren(etree.Element):
+                        period_tag = localname(period_node.tag)
+                        if period_tag == "Point":
+                            period["points"].append(text_children(period_node, ""))
+                        elif period_tag == "timeInterval":
+                            period.update(text_children(period_node, ""))
+                        elif period_tag == "resolution":
+                            period["resolution"] = period_node.text
+                    periods.append(period)
+                elif first and node_tag != "Reason":
+                    infos[f"TimeSeries.{node_tag}"] = node.text
+        elif tag in ("mRID", "revisionNumber"):
+            fields[tag] = child.text
+    reason = reason or {}
+    if not (reason.get("Reason.text") or "").strip():
+        reason["Reason.text"] = ""
+    return Outage(fields, interval, periods, assets, {**(infos or {}), **reason})
+
+
+def joined_assets(assets: List[Dict]) -> Dict[str, str]:
+    """Asset fields as metadata `Asset_RegisteredResource.<field>`, values joined by ", "."""
+    joined: Dict[str, List[str]] = {}
+    for asset in assets:
+        for key, value in asset.items():
+            joined.setdefault(f"Asset_RegisteredResource.{key}", []).append(value or "")
+    return {key: ", ".join(values) for key, values in joined.items()}
+
+
+def asset_frame(records: List[Dict], categorical: bool = True) -> pd.DataFrame:
+    """
+    Distinct assets of each outage: `series_id` and the `Asset_RegisteredResource` fields,
+    e.g. `mRID`, `name`, `asset_PSRType.psrType` and `location.name`, as categoricals
+    with `categorical`. Joins the outages' `series` on `series_id`.
+    """
+    assets = pd.DataFrame.from_records(records, columns=list(dict.fromkeys(
+        ["series_id", *(key for record in records for key in record)]
+    )))
+    assets = assets[~assets.duplicated().to_numpy()].reset_index(drop=True)
+    assets["series_id"] = assets["series_id"].astype(np.int32)
+    if categorical:
+        assets = assets.astype({column: "category" for column in assets.columns[1:]})
+    return assets
 
 
-def get_resource(Period: etree._Element) -> Dict:
+def outage_points(outage: Outage) -> tuple[np.ndarray, Dict[str, np.ndarray], Dict]:
     """
-    Handle the case when there are multiple affected assets
-    :param Period:
-    :return:
+    -> timestamps of the Points, see `Period_timestamps`, columns of Point values, metadata
+
+    Points of all `Available_Periods` are positioned within the document's
+    `unavailability_Time_Period.timeInterval` at the resolution of the first one.
     """
-    tag_available = Period.find("./TimeSeries/Asset_RegisteredResource")
-    if tag_available is not None:
-        points = Period.xpath("./TimeSeries/Asset_RegisteredResource")
-        data = [
-            dict([(f"Asset_RegisteredResource.{datum.tag}", datum.text) for datum in point.iterchildren()])
-            for point in points
-        ]
-        if len(data) == 0:
-            data = [{'Asset_RegisteredResource.mRID': '',
-                     'Asset_RegisteredResource.name': '',
-                     'Asset_RegisteredResource.asset_PSRType.psrType': '',
-                     'Asset_RegisteredResource.location.name': ''
-                     }]
-        if all(isinstance(entry, dict) for entry in data):
-            result = {}
-            for entry in data:
-                for key, value in entry.items():
-                    result.setdefault(key, []).append(value)
-            result = {key: ', '.join(values) for key, values in result.items()}
-        return result
-
-
-def get_infos(Period: etree._Element) -> Dict:
-    """
-    Get additional infos of the document for the series
-    """
-    points = Period.xpath("//TimeSeries", namespaces=Period.nsmap)
-    data = [
-        dict([(f"TimeSeries.{datum.tag}", datum.text) for datum in point.iterchildren()])
-        for point in points
-    ][0]
-    data.pop('TimeSeries.Asset_RegisteredResource', None)
-    data.pop('TimeSeries.Available_Period', None)
-    data.pop('TimeSeries.Reason', None)
-    return data
+    points = [point for period in outage.periods for point in period["points"]]
+    resolution = next((period["resolution"] for period in outage.periods if "resolution" in period), None)
+    columns = records_to_columns(points)
+    positions = columns["position"].astype(np.int64) if points else np.zeros(0, dtype=np.int64)
+    timestamps = Period_timestamps(outage.interval["start"], outage.interval["end"], resolution)
+    return timestamps[positions - 1], columns, outage.metadata
 
 
-def get_reason(Period: etree._Element) -> Dict:
+def outage_intervals(outage: Outage) -> tuple[np.ndarray, Dict[str, np.ndarray], Dict]:
     """
-    Get the reason for the outage
+    -> start of each segment in UTC nanoseconds, columns `end` and `quantity`, metadata
+
+    A Point's quantity is available from its position until the next Point's position,
+    the last until the end of its `Available_Period`. Consecutive segments of equal
+    quantity are merged, hence rows scale with changes of availability instead of
+    the duration of the outage.
     """
-    points = Period.xpath("./Reason", namespaces=Period.nsmap)
-    data = [
-        dict([(f"Reason.{datum.tag}", datum.text) for datum in point.iterchildren()])
-        for point in points
-    ][0]
-    if 'Reason.text' not in data:
-        data['Reason.text'] = ''
-    else:
-        if data['Reason.text'] == '\n    ':
-            data['Reason.text'] = ''
-    return data
+    starts, ends = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+    quantities = [np.zeros(0, dtype=object)]
+    for period in outage.periods:
+        if not period["points"]:
+            continue
+        timestamps = Period_timestamps(period["start"], period["end"], period["resolution"])
+        positions = np.array([int(point["position"]) for point in period["points"]])
+        quantity = np.array([point.get("quantity") for point in period["points"]], dtype=object)
+        period_starts = timestamps[positions - 1]
+        period_ends = np.append(period_starts[1:], pd.Timestamp(period["end"]).value)
+        first = np.append(True, quantity[1:] != quantity[:-1])
+        last = np.append(first[1:], True)
+        starts.append(period_starts[first])
+        ends.append(period_ends[last])
+        quantities.append(quantity[first])
+    columns = {
+        "end": np.concatenate(ends).view("datetime64[ns]"),
+        "quantity": np.concatenate(quantities),
+    }
+    return np.concatenate(starts), columns, outage.metadata
 
 
 def outage_transmission() -> Callable:
-    def outage_dataframe(Period: etree._Element) -> pd.DataFrame:
+    def outage_dataframe(
+        documents,
+        float_dtype=np.float64,
+        categorical: bool = True,
+        normalized: bool = False,
+        sink: Union[str, Sinks.Sink] = "pandas",
+        intervals: bool = False,
+    ) -> Union[pd.DataFrame, Tables]:
         """
-        Build the dataframe from the series
+        Builds one DataFrame from an `Unavailability_MarketDocument` or an iterable of them,
+        e.g. the members of a ZIP archive. Documents are consumed one at a time into one
+        `ColumnBuilder`, each as a single series.
+
+        With `intervals`, rows are the document's availability segments indexed by their
+        start, see `outage_intervals`, instead of its Points.
+        With `normalized`, assets are not joined into metadata but returned as
+        `Tables.assets`, see `asset_frame`.
+        Both add the document's `mRID` and `revisionNumber` to the metadata.
         """
-        index, data = get_data(Period=Period)
-        assert len(data) == len(index)
-        df = pd.DataFrame(data=data, index=index)
-        resource = get_resource(Period=Period)
-        infos = get_infos(Period=Period)
-        reason = get_reason(Period=Period)
-        if resource is not None:
-            final = df.assign(**{**resource, **infos, **reason})
+        if isinstance(documents, etree._Element):
+            documents = [documents]
+        if not normalized:
+            builder = ColumnBuilder(float_dtype=float_dtype, categorical=categorical, sink=sink)
         else:
-            final = df.assign(**{**infos, **reason})
-        return final
+            builder = TablesBuilder(float_dtype=float_dtype, categorical=categorical)
+        rows = outage_intervals if intervals else outage_points
+        assets: List[Dict] = []
+        for document in documents:
+            outage = walk_outage(document)
+            timestamps, columns, outage_metadata = rows(outage)
+            metadata = dict(outage.document) if intervals or normalized else {}
+            if normalized:
+                series_id = len(builder.series)
+                assets.extend({"series_id": series_id, **asset} for asset in outage.assets)
+            else:
+                metadata.update(joined_assets(outage.assets))
+            metadata.update(outage_metadata)
+            builder.append_Period(timestamps, columns, metadata)
+            builder.end_TimeSeries({})
+        if not normalized:
+            return builder.to_frame({})
+        tables = builder.to_frame({})._replace(assets=asset_frame(assets, categorical))
+        return sink_tables(tables, Sinks.get_sink(sink))
     return outage_dataframe
 
 
+def concat_documents(dfs: List) -> Union[pd.DataFrame, Tables]:
+    """
+    Concatenates parsed documents in the frame type of their sink, see `Sinks.Sink.concat`.
+    `Tables` go through `concat_tables`.
+    """
+    if isinstance(dfs[0], Tables):
+        return concat_tables(dfs)
+    return Sinks.sink_of(dfs[0]).concat(dfs)
+
+
+def concat_tables(tables: List[Tables]) -> Tables:
+    """
+    Concatenates `Tables`, renumbering `series_id` to stay unique.
+    Tables of other sinks are combined in pandas and converted back.
+    """
+    sink = Sinks.sink_of(tables[0].values)
+    tables = [pandas_tables(table) for table in tables]
+    offsets = np.cumsum([0] + [len(table.series) for table in tables[:-1]])
+    series = pd.concat([table.series for table in tables], ignore_index=True)
+    series.index.name = "series_id"
+    values = concat_series_frames([table.values for table in tables], offsets)
+    assets = concat_series_frames([table.assets for table in tables], offsets)
+    return sink_tables(Tables(series, values, assets), sink)
+
+
+def concat_series_frames(frames: List, offsets) -> pd.DataFrame:
+    """Frames referencing `series_id`, shifted by their table's offset; None if all are None."""
+    frames = [
+        frame.assign(series_id=frame["series_id"] + np.int32(offset))
+        for frame, offset in zip(frames, offsets)
+        if frame is not None
+    ]
+    if not frames:
+        return None
+    return concat_documents(frames).reset_index(drop=True)
+
+
+def record_columns(columns) -> List[str]:
+    """
+    Columns identifying a record across documents.
+    Document-level metadata such as the document mRID or `createdDateTime` differs
+    between responses and TimeSeries mRIDs are document-local, hence both are ignored.
+    """
+    return [
+        column
+        for column in columns
+        if not column.split(".")[0].endswith("_MarketDocument")
+        and column != "TimeSeries.mRID"
+    ]
+
+
+def drop_duplicate_records(df):
+    """Drops rows repeated across documents, e.g. Periods returned by two adjacent queries."""
+    sink = Sinks.sink_of(df)
+    return sink.drop_duplicates(df, record_columns(sink.columns(df)))
+
+
+def drop_duplicate_tables(tables: Tables) -> Tables:
+    """`drop_duplicate_records` for `Tables`: repeated series are merged into their first occurrence."""
+    sink = Sinks.sink_of(tables.values)
+    series, values, assets = pandas_tables(tables)
+    keys = series[record_columns(series.columns)].apply(tuple, axis=1)
+    codes, _ = pd.factorize(keys)
+    first = ~pd.Series(codes).duplicated().to_numpy()
+    series = series[first].reset_index(drop=True)
+    series.index.name = "series_id"
+    values = merge_series(values, codes)
+    if assets is not None:
+        assets = merge_series(assets, codes)
+    return sink_tables(Tables(series, values, assets), sink)
+
+
+def merge_series(df: pd.DataFrame, codes: np.ndarray) -> pd.DataFrame:
+    """Maps `series_id` to `codes`, the merged series, and drops the rows repeated thereby."""
+    df = df.assign(series_id=codes[df["series_id"].to_numpy()].astype(np.int32))
+    return df[~df.duplicated().to_numpy()].reset_index(drop=True)
+
+
 StandardOutagesTransmissionParser = outage_transmission()
 StandardPeriodParser = Period_to_DataFrame_fn(get_Period_data)
+StandardDocumentParser = Document_to_DataFrame()
 StandardErrorDocumentParser = Root_to_DataFrame_fn()
@@ -0,0 +1,272 @@
+"""
+Output backends of the parsers.
+
+Document parsers fill a columnar record layer, `Records`: typed numpy arrays,
+metadata as dictionary-encoded `Categories` and a UTC `DatetimeIndex`.
+A `Sink` turns `Records` into the frame of a DataFrame library:
+`pandas.DataFrame` (default), `pyarrow.Table` or `polars.DataFrame`.
+Frames without an index receive the timestamps as first column `timestamp`.
+
+pyarrow and polars are optional dependencies, imported when available.
+Frames not built from `Records`, e.g. merged `Tables`, are converted from pandas.
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, List, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+class Categories(NamedTuple):
+    """Dictionary-encoded column: `codes` into `categories`, -1 for missing values."""
+    codes: np.ndarray
+    categories: List
+
+
+class Records(NamedTuple):
+    index: pd.DatetimeIndex
+    columns: Dict[str, Union[np.ndarray, Categories]]
+
+
+def index_as_column(df: pd.DataFrame) -> pd.DataFrame:
+    """Timestamps and named indexes such as `series_id` become the first column."""
+    if isinstance(df.index, pd.DatetimeIndex):
+        return df.rename_axis("timestamp").reset_index()
+    if df.index.name is not None:
+        return df.reset_index()
+    return df.reset_index(drop=True)
+
+
+class Sink(ABC):
+    name: str = None
+
+    @staticmethod
+    @abstractmethod
+    def is_frame(frame) -> bool:
+        pass
+
+    @abstractmethod
+    def from_records(self, records: Records):
+        pass
+
+    @abstractmethod
+    def from_pandas(self, df: pd.DataFrame):
+        pass
+
+    @abstractmethod
+    def to_pandas(self, frame) -> pd.DataFrame:
+        pass
+
+    @abstractmethod
+    def columns(self, frame) -> List[str]:
+        pass
+
+    @abstractmethod
+    def concat(self, frames: List):
+        """Concatenates frames of consecutive documents; missing columns are null."""
+        pass
+
+    @abstractmethod
+    def drop_duplicates(self, frame, subset: List[str]):
+        """Keeps the first of the rows equal in `subset`."""
+        pass
+
+    def copy(self, frame):
+        """Frame for another caller; immutable frames are shared."""
+        return frame
+
+
+class PandasSink(Sink):
+    name = "pandas"
+
+    @staticmethod
+    def is_frame(frame) -> bool:
+        return isinstance(frame, pd.DataFrame)
+
+    def from_records(self, records: Records) -> pd.DataFrame:
+        data = {}
+        for name, values in records.columns.items():
+            if isinstance(values, Categories):
+                values = pd.Categorical.from_codes(values.codes, categories=values.categories)
+            elif values.dtype.kind == "M":
+                values = pd.array(values).tz_localize("UTC")
+            data[name] = values
+        return pd.DataFrame(data, index=records.index, columns=list(records.columns))
+
+    def from_pandas(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df
+
+    def to_pandas(self, frame: pd.DataFrame) -> pd.DataFrame:
+        return frame
+
+    def columns(self, frame: pd.DataFrame) -> List[str]:
+        return list(frame.columns)
+
+    def concat(self, frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Categorical columns stay categorical: they are united column by column,
+        the remaining columns are concatenated by `pd.concat`.
+        """
+        if len(frames) == 1:
+            return frames[0]
+        columns = list(dict.fromkeys(column for df in frames for column in df.columns))
+        categorical = [
+            column
+            for column in columns
+            if any(isinstance(df.dtypes.get(column), pd.CategoricalDtype) for df in frames)
+        ]
+        df = pd.concat([df.drop(columns=categorical, errors="ignore") for df in frames], axis=0)
+        for column in categorical:
+            df[column] = self.union_categorical(
+                [df_part[column] if column in df_part.columns else len(df_part) for df_part in frames]
+            )
+        return df[columns]
+
+    @staticmethod
+    def union_categorical(parts: List[Union[pd.Series, int]]) -> pd.Categorical:
+        """
+        Concatenates categorical `parts` by remapping their codes into the ordered union
+        of their categories. Integer parts are that many missing values.
+        """
+        categories: Dict = {}
+        codes = []
+        for part in parts:
+            if isinstance(part, int):
+                codes.append(np.full(part, -1, dtype=np.int32))
+                continue
+            part = pd.Categorical(part)
+            mapping = np.array(
+                [categories.setdefault(category, len(categories)) for category in part.categories] + [-1],
+                dtype=np.int32,
+            )
+            codes.append(mapping[part.codes])  # Code -1 maps to the trailing -1.
+        return pd.Categorical.from_codes(np.concatenate(codes), categories=list(categories))
+
+    def copy(self, frame: pd.DataFrame) -> pd.DataFrame:
+        return frame.copy()
+
+    def drop_duplicates(self, frame: pd.DataFrame, subset: List[str]) -> pd.DataFrame:
+        """The index, i.e. the timestamp, is part of the compared values."""
+        duplicated = frame[subset].assign(__index=frame.index).duplicated().to_numpy()
+        return frame[~duplicated]
+
+
+class ArrowSink(Sink):
+    name = "pyarrow"
+
+    def __init__(self):
+        if pa is None:
+            raise ImportError("The pyarrow sink requires `pyarrow`.")
+
+    @staticmethod
+    def is_frame(frame) -> bool:
+        return pa is not None and isinstance(frame, pa.Table)
+
+    @staticmethod
+    def array(values: Union[np.ndarray, Categories]) -> "pa.Array":
+        if isinstance(values, Categories):
+            codes = pa.array(values.codes, mask=values.codes < 0)
+            return pa.DictionaryArray.from_arrays(codes, pa.array(values.categories, pa.string()))
+        if values.dtype.kind == "M":
+            return pa.array(values, pa.timestamp("ns", tz="UTC"))
+        return pa.array(values, from_pandas=True)  # NaN and None are null.
+
+    def from_records(self, records: Records) -> "pa.Table":
+        arrays = [pa.array(records.index)]
+        arrays.extend(self.array(values) for values in records.columns.values())
+        return pa.Table.from_arrays(arrays, names=["timestamp", *records.columns])
+
+    def from_pandas(self, df: pd.DataFrame) -> "pa.Table":
+        return pa.Table.from_pandas(index_as_column(df), preserve_index=False)
+
+    def to_pandas(self, frame: "pa.Table") -> pd.DataFrame:
+        return frame.to_pandas()
+
+    def columns(self, frame: "pa.Table") -> List[str]:
+        return frame.column_names
+
+    def concat(self, frames: List["pa.Table"]) -> "pa.Table":
+        return pa.concat_tables(frames, promote_options="permissive").unify_dictionaries()
+
+    def drop_duplicates(self, frame: "pa.Table", subset: List[str]) -> "pa.Table":
+        rows = frame.append_column("__row", pa.array(np.arange(frame.num_rows)))
+        first = rows.group_by(subset, use_threads=False).aggregate([("__row", "min")])
+        return frame.take(np.sort(first["__row_min"].to_numpy()))
+
+
+class PolarsSink(Sink):
+    name = "polars"
+
+    def __init__(self):
+        if pl is None:
+            raise ImportError("The polars sink requires `polars`.")
+
+    @staticmethod
+    def is_frame(frame) -> bool:
+        return pl is not None and isinstance(frame, pl.DataFrame)
+
+    @staticmethod
+    def series(name: str, values: Union[np.ndarray, Categories]) -> "pl.Series":
+        if isinstance(values, Categories):
+            categories = pl.Series(name, values.categories, pl.String)
+            codes = pl.Series(values.codes).set(pl.Series(values.codes < 0), None)
+            return categories.gather(codes).cast(pl.Categorical)
+        if values.dtype.kind == "M":
+            return pl.Series(name, values).dt.replace_time_zone("UTC")
+        if values.dtype == object:
+            # Absent values are NaN among strings, which polars does not take for null.
+            return pl.Series(name, np.where(pd.isna(values), None, values).tolist(), strict=False)
+        return pl.Series(name, values, nan_to_null=True)
+
+    def from_records(self, records: Records) -> "pl.DataFrame":
+        index = records.index.tz_convert(None).to_numpy()
+        series = [self.series("timestamp", index)]
+        series.extend(self.series(name, values) for name, values in records.columns.items())
+        return pl.DataFrame(series)
+
+    def from_pandas(self, df: pd.DataFrame) -> "pl.DataFrame":
+        return pl.from_pandas(index_as_column(df))
+
+    def to_pandas(self, frame: "pl.DataFrame") -> pd.DataFrame:
+        return frame.to_pandas()
+
+    def columns(self, frame: "pl.DataFrame") -> List[str]:
+        return frame.columns
+
+    def concat(self, frames: List["pl.DataFrame"]) -> "pl.DataFrame":
+        return pl.concat(frames, how="diagonal_relaxed")
+
+    def copy(self, frame: "pl.DataFrame") -> "pl.DataFrame":
+        return frame.clone()
+
+    def drop_duplicates(self, frame: "pl.DataFrame", subset: List[str]) -> "pl.DataFrame":
+        return frame.unique(subset=subset, keep="first", maintain_order=True)
+
+
+SINKS = {sink.name: sink for sink in (PandasSink, ArrowSink, PolarsSink)}
+
+
+def get_sink(sink: Union[str, Sink] = "pandas") -> Sink:
+    if isinstance(sink, Sink):
+        return sink
+    try:
+        return SINKS[sink]()
+    except KeyError:
+        raise ValueError(sink)
+
+
+def sink_of(frame) -> Sink:
+    for sink in SINKS.values():
+        if sink.is_frame(frame):
+            return sink()
+    raise TypeError(type(frame))
@@ -40,9 +40,7 @@ class TransmissionNetwork_MarketDocument_Parser(
         self.set_TimeSeries_Parser(
             utils.Tree_to_DataFrame(self.Series_Period_Parser, "Period")
         )
-        self.set_Document_Parser(
-            utils.Tree_to_DataFrame(self.TimeSeries_Parser, "TimeSeries")
-        )
+        self.set_Document_Parser(utils.StandardDocumentParser)
 
     def parse(self):
-        return self.Document_Parser(self.objectified_input_xml)
+        return self.Document_Parser(self.objectified_input_xml, **self.options)
@@ -1,3 +1,5 @@
+import pandas as pd
+
 from entsoe_client.ParameterTypes import *
 from entsoe_client.Queries import Query
 
@@ -86,6 +88,8 @@ class CurrentBalancingState(Balancing):
             TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(days=100)
+
     def __init__(
         self,
         Area_Domain=None,  # Does not appear in documentation.
@@ -115,6 +119,8 @@ class AggregatedBalancingEnergyBids(Balancing):
     ENTSOE Example uses aFRR (A51).
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         processType: ProcessType = ProcessType.A51,
@@ -218,6 +224,8 @@ class AmountOfBalancingReservesUnderContract(Balancing):
             offset=n returns files in sequence between n+1 and n+100)
     """
 
+    document_limit = 100
+
     def __init__(
         self,
         type_MarketAgreementType: MarketAgreementType = None,
@@ -257,6 +265,8 @@ class PricesOfProcuredBalancingReserves(Balancing):
                 offset=n returns files in sequence between n+1 and n+100)
     """
 
+    document_limit = 100
+
     def __init__(
         self,
         type_MarketAgreementType: MarketAgreementType = MarketAgreementType("Daily"),
@@ -293,6 +303,8 @@ class AcceptedAggregatedOffers(Balancing):
         PsrType
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         controlArea_Domain: Area = None,
@@ -328,6 +340,8 @@ class ActivatedBalancingEnergy(Balancing):
     ENTSOE Example uses FCR.
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         controlArea_Domain: Area = None,
@@ -363,6 +377,8 @@ class PricesOfActivatedBalancingEnergy(Balancing):
     ENTSOE Example uses aFRR (A96).
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         controlArea_Domain: Area = None,
@@ -394,6 +410,8 @@ class ImbalancePrices(Balancing):
         PsrType
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         controlArea_Domain: Area = None,
@@ -421,6 +439,8 @@ class TotalImbalanceVolumes(Balancing):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self, controlArea_Domain: Area = None, periodStart=None, periodEnd=None
     ):
@@ -443,6 +463,8 @@ class FinancialExpensesAndIncomeForBalancing(Balancing):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self, controlArea_Domain: Area = None, periodStart=None, periodEnd=None
     ):
@@ -469,6 +491,8 @@ class CrossborderBalancing(Balancing):
     maximum_Price.amount attributes.
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         Acquiring_Domain: Area = None,
@@ -496,6 +520,8 @@ class FCRTotalCapacity(Balancing):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         businessType: BusinessType = BusinessType.A25,
@@ -523,6 +549,8 @@ class SharesOfFCRCapacity_ShareOfCapacity(Balancing):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(self, Area_Domain: Area = None, periodStart=None, periodEnd=None):
         super(SharesOfFCRCapacity_ShareOfCapacity, self).__init__(
             documentType=DocumentType.A26,
@@ -544,6 +572,8 @@ class SharesOfFCRCapacity_ContractedReserveCapacity(Balancing):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(self, Area_Domain: Area = None, periodStart=None, periodEnd=None):
         super(SharesOfFCRCapacity_ContractedReserveCapacity, self).__init__(
             documentType=DocumentType.A26,
@@ -614,6 +644,8 @@ class SharingOfRRAndFRR(Balancing):
     ENTSOE Example uses FRR (A56).
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         processType: ProcessType = ProcessType.A56,
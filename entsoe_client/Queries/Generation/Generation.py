@@ -69,6 +69,8 @@ class InstalledGenerationCapacityAggregated(Generation):
         PsrType (When used, only queried production document_type is returned)
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         processType: ProcessType = ProcessType.A33,
@@ -101,6 +103,8 @@ class InstalledGenerationCapacityPerUnit(Generation):
         PsrType (When used, only queried production document_type is returned)
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         processType: ProcessType = ProcessType.A33,
@@ -131,6 +135,8 @@ class DayAheadAggregatedGeneration(Generation):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area = None,
@@ -162,6 +168,8 @@ class DayAheadGenerationForecastsWindSolar(Generation):
             PsrType (When used, only queried production document_type is returned)
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area = None,
@@ -193,6 +201,8 @@ class CurrentGenerationForecastsWindSolar(Generation):
         PsrType (When used, only queried production document_type is returned)
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area = None,
@@ -224,6 +234,8 @@ class IntradayGenerationForecastsWindSolar(Generation):
         PsrType (When used, only queried production document_type is returned)
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area = None,
@@ -256,6 +268,8 @@ class ActualGenerationOutputPerGenerationUnit(Generation):
         RegisteredResource (EIC of Generation Unit)
     """
 
+    range_limit = pd.DateOffset(days=1)
+
     def __init__(
         self,
         processType: ProcessType = ProcessType.A16,
@@ -295,6 +309,8 @@ class AggregatedGenerationPerType(Generation):
     while outBiddingZone_Domain reflects Consumption values.
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         processType: ProcessType = ProcessType.A16,
@@ -325,6 +341,8 @@ class AggregatedFillingRateOfWaterReservoirsAndHydroStoragePlants(Generation):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area = None,
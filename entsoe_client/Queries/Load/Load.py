@@ -40,6 +40,8 @@ class ActualTotalLoad(Load):
     # q = ActualTotalLoad(Area.CZ, '201512312300', '201612312300')
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         outBiddingZone_Domain: Area,
@@ -66,6 +68,8 @@ class DayAheadTotalLoad(Load):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         outBiddingZone_Domain: Area,
@@ -90,6 +94,8 @@ class WeekAheadTotalLoad(Load):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         outBiddingZone_Domain: Area,
@@ -114,6 +120,8 @@ class MonthAheadTotalLoad(Load):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         outBiddingZone_Domain: Area,
@@ -135,6 +143,8 @@ class YearAheadTotalLoad(Load):
         TimeInterval or combination of PeriodStart and PeriodEnd
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         outBiddingZone_Domain: Area,
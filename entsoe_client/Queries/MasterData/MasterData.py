@@ -62,6 +62,8 @@ class ProductionAndGenerationUnits(MasterData):
         PsrType
     """
 
+    range_limit = pd.DateOffset(days=1)
+
     def __init__(
         self,
         biddingZone_Domain: Area = None,
@@ -1,3 +1,5 @@
+import pandas as pd
+
 from ...ParameterTypes import *
 from ..Query import Query
 
@@ -95,6 +97,8 @@ class UnavailabilityOfConsumptionUnits(Outages):
         BusinessType
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         biddingZone_Domain: Area = None,
@@ -136,6 +140,9 @@ class UnavailabilityOfTransmissionInfrastructure(Outages):
     TODO: Missing Parameter: TimeIntervalUpdate or combination of PeriodStartUpdate and PeriodEndUpdate
     """
 
+    range_limit = pd.DateOffset(years=1)
+    document_limit = 200
+
     def __init__(
         self,
         in_Domain: Area = None,
@@ -183,6 +190,9 @@ class UnavailabilityOfOffshoreGridInfrastructure(Outages):
     TODO: Missing Parameter: TimeIntervalUpdate or combination of PeriodStartUpdate and PeriodEndUpdate
     """
 
+    range_limit = pd.DateOffset(years=1)
+    document_limit = 200
+
     def __init__(
         self,
         biddingZone_Domain: Area = None,
@@ -228,6 +238,9 @@ class UnavailabilityOfGenerationUnits(Outages):
     TODO: Missing Parameter: TimeIntervalUpdate or combination of PeriodStartUpdate and PeriodEndUpdate
     """
 
+    range_limit = pd.DateOffset(years=1)
+    document_limit = 200
+
     def __init__(
         self,
         biddingZone_Domain: Area = None,
@@ -277,6 +290,9 @@ class UnavailabilityOfProductionUnits(Outages):
     TODO: Missing Parameter: TimeIntervalUpdate or combination of PeriodStartUpdate and PeriodEndUpdate
     """
 
+    range_limit = pd.DateOffset(years=1)
+    document_limit = 200
+
     def __init__(
         self,
         biddingZone_Domain: Area = None,
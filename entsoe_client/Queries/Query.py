@@ -1,4 +1,5 @@
-from typing import Any, Dict, Union
+import copy
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
 from pandas import Timestamp
@@ -12,6 +13,13 @@ class Query:
     Exhaustive parameter list.
     """
 
+    # Longest period between `periodStart` and `periodEnd` the API accepts, if documented.
+    range_limit: Optional[pd.DateOffset] = None
+    # Documents per response of queries that page through `offset`.
+    document_limit: Optional[int] = None
+    # Largest `offset` the API accepts.
+    offset_limit: int = 4800
+
     def __init__(
         self,
         documentType: DocumentType = None,
@@ -93,6 +101,55 @@ class Query:
         if isinstance(dateformat, int):
             return dateformat
 
+    @staticmethod
+    def timestamp_parser(dateformat: int) -> Timestamp:
+        """Inverse of `datetime_parser`."""
+        return pd.to_datetime(str(dateformat), format="%Y%m%d%H%M", utc=True)
+
+    def split(
+        self,
+        range_limit: Optional[pd.DateOffset] = None,
+        boundaries: Iterable[Timestamp] = (),
+    ) -> List["Query"]:
+        """
+        Splits the query into consecutive copies with adjacent periods.
+        Each period spans at most `range_limit`, defaulting to the query's `range_limit`,
+        and additionally ends at each of the `boundaries` within the period.
+        """
+        range_limit = range_limit if range_limit is not None else self.range_limit
+        if self.periodStart is None or self.periodEnd is None:
+            return [self]
+        start = self.timestamp_parser(self.periodStart)
+        end = self.timestamp_parser(self.periodEnd)
+        cuts = sorted(
+            set(
+                boundary.floor("min")
+                for boundary in map(pd.Timestamp, boundaries)
+                if start < boundary < end
+            )
+        )
+        periods = []
+        for segment_start, segment_end in zip([start] + cuts, cuts + [end]):
+            chunk_start = segment_start
+            while range_limit is not None and chunk_start + range_limit < segment_end:
+                periods.append((chunk_start, chunk_start + range_limit))
+                chunk_start = chunk_start + range_limit
+            periods.append((chunk_start, segment_end))
+        if len(periods) == 1:
+            return [self]
+        queries = []
+        for chunk_start, chunk_end in periods:
+            query = copy.copy(self)
+            query.periodStart = self.datetime_parser(chunk_start)
+            query.periodEnd = self.datetime_parser(chunk_end)
+            queries.append(query)
+        return queries
+
+    def with_offset(self, offset: int) -> "Query":
+        query = copy.copy(self)
+        query.offset = offset
+        return query
+
     def __call__(self) -> Dict:
         _ = self.__dict__
         _ = dict(
@@ -136,6 +136,8 @@ class ForecastedCapacity(Transmission):
     #                        periodStart='201512312300', periodEnd='201612312300')
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         marketAgreementType: MarketAgreementType,
@@ -261,6 +263,8 @@ class IntradayTransferLimits(Transmission):
     #                         periodStart='201512312300', periodEnd='201601312300')
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area,
@@ -378,6 +382,8 @@ class TotalCapacityNominated(Transmission):
 
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area,
@@ -444,6 +450,8 @@ class DayAheadPrices(Transmission):
     In_Domain and Out_Domain must be populated with the same area EIC code
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area,
@@ -511,6 +519,8 @@ class ImplicitAuctionCongestionIncome(Transmission):
     In_Domain and Out_Domain must be populated with the same bidding zone EIC code
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         contract_MarketAgreementType: MarketAgreementType,
@@ -545,6 +555,8 @@ class CommercialSchedules(Transmission):
         Contract Type
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area,
@@ -577,6 +589,8 @@ class TotalCommercialSchedules(Transmission):
         Contract Type (A05)
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area,
@@ -608,6 +622,8 @@ class DayAheadCommercialSchedules(Transmission):
         Contract Type (A01)
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area,
@@ -638,6 +654,8 @@ class PhysicalFlows(Transmission):
     Unlike Web GUI, API responds not netted values as data is requested per direction.
     """
 
+    range_limit = pd.DateOffset(years=1)
+
     def __init__(
         self,
         in_Domain: Area,
@@ -0,0 +1,147 @@
+"""
+Client-side throttling for the ENTSO-E request quota.
+
+The Transparency Platform limits every security token to a fixed number of requests
+per minute and temporarily bans tokens exceeding it. A token bucket refills at the
+permitted rate; every request takes one token and waits if the bucket is empty.
+
+`TokenBucket` is shared between the threads of one process.
+`SQLiteTokenBucket` keeps the bucket in a SQLite file and is shared between processes.
+"""
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+# https://transparency.entsoe.eu/content/static_content/Static%20content/web%20api/Guide.html
+ENTSOE_REQUESTS_PER_MINUTE = 400
+
+
+class RateLimiter(ABC):
+    @abstractmethod
+    def acquire(self, tokens: int = 1) -> None:
+        """Blocks until `tokens` requests may be issued."""
+        pass
+
+    def __call__(self, tokens: int = 1) -> None:
+        self.acquire(tokens)
+
+
+class TokenBucket(RateLimiter):
+    """
+    Thread-safe token bucket.
+
+    `rate` tokens per second are added up to `capacity`, which bounds the burst size.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError(rate)
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        if self.capacity < 1:
+            raise ValueError(capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    @classmethod
+    def per_minute(cls, requests: float = ENTSOE_REQUESTS_PER_MINUTE, **kwargs):
+        return cls(rate=requests / 60.0, **kwargs)
+
+    def _take(self, tokens: float, available: float, elapsed: float):
+        """-> (remaining tokens, seconds to wait); nothing is taken if waiting is required."""
+        available = min(self.capacity, available + max(elapsed, 0.0) * self.rate)
+        if available >= tokens:
+            return available - tokens, 0.0
+        return available, (tokens - available) / self.rate
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        """Takes `tokens` if available and returns 0, else returns the seconds to wait."""
+        if tokens > self.capacity:
+            raise ValueError(tokens)
+        with self._lock:
+            now = self.clock()
+            self._tokens, wait = self._take(tokens, self._tokens, now - self._updated)
+            self._updated = now
+        return wait
+
+    def acquire(self, tokens: int = 1) -> None:
+        while True:
+            wait = self.try_acquire(tokens)
+            if not wait:
+                return
+            self.sleep(wait)
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """
+    Token bucket persisted in a SQLite database at `path`.
+
+    All processes using the same `path` and `name` draw from one bucket.
+    The bucket state is updated in an exclusive transaction, which serializes
+    concurrent processes through SQLite's file lock.
+    Uses wall-clock time, as monotonic clocks are not comparable across processes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rate: float,
+        capacity: Optional[float] = None,
+        name: str = "entsoe",
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        timeout: float = 30.0,
+    ):
+        super(SQLiteTokenBucket, self).__init__(
+            rate=rate, capacity=capacity, clock=clock, sleep=sleep
+        )
+        self.path = path
+        self.name = name
+        self.timeout = timeout
+        connection = self._connect()
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS token_bucket "
+                "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        if tokens > self.capacity:
+            raise ValueError(tokens)
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            now = self.clock()
+            row = connection.execute(
+                "SELECT tokens, updated FROM token_bucket WHERE name = ?", (self.name,)
+            ).fetchone()
+            available, updated = row if row else (self.capacity, now)
+            available, wait = self._take(tokens, available, now - updated)
+            connection.execute(
+                "INSERT OR REPLACE INTO token_bucket (name, tokens, updated) VALUES (?, ?, ?)",
+                (self.name, available, now),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+        return wait
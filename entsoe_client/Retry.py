@@ -0,0 +1,220 @@
+"""
+Retry policy for requests to the ENTSO-E API.
+
+Only transient failures are retried: throttling (429), server errors (5xx),
+connection errors and timeouts. Waits grow exponentially with full jitter and
+respect the server's `Retry-After` header.
+
+A `CircuitBreaker` shared by all threads of a client stops every worker from
+sending requests once consecutive failures indicate that the API is down,
+until `reset_timeout` has passed.
+"""
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable, Optional
+
+import requests
+import tenacity
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures.
+    While open, `before_request` blocks until `reset_timeout` seconds have passed,
+    or raises `CircuitOpenError` if `block` is False.
+    Then the circuit is half-open: exactly one request probes the API while all others
+    keep waiting, or raising. A success of the probe closes the circuit, a failure
+    opens it again; a probe ending without either, see `release`, lets the next
+    request probe.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        block: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.block = block
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._resolved = threading.Condition(self._lock)
+        self._failures = 0
+        self._open_until = 0.0
+        self._half_open = False  # Opened before, the next request is a probe.
+        self._probe: Optional[int] = None  # Thread of the probe in flight.
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self.clock() < self._open_until
+
+    def before_request(self) -> None:
+        while True:
+            with self._lock:
+                remaining = self._open_until - self.clock()
+                if remaining <= 0 and self._probe is None:
+                    if self._half_open:
+                        self._half_open = False
+                        self._probe = threading.get_ident()
+                    return
+                if not self.block:
+                    raise CircuitOpenError(
+                        f"ENTSO-E API unavailable, retry in {max(remaining, 0):.0f}s."
+                    )
+                if remaining <= 0:  # Another request probes, wait for its outcome.
+                    self._resolved.wait(timeout=self.reset_timeout)
+                    continue
+            self.sleep(remaining)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._half_open = False
+            self._probe = None
+            self._resolved.notify_all()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold or self._probe == threading.get_ident():
+                logging.warning(
+                    f"{self._failures} consecutive failures, pausing requests for {self.reset_timeout}s."
+                )
+                self._open_until = self.clock() + self.reset_timeout
+                self._failures = 0
+                self._half_open = True
+                self._probe = None
+                self._resolved.notify_all()
+
+    def release(self) -> None:
+        """Ends a probe of this thread that neither succeeded nor failed, e.g. on a local error."""
+        with self._lock:
+            if self._probe == threading.get_ident():
+                self._half_open = True
+                self._probe = None
+                self._resolved.notify_all()
+
+
+def retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """Seconds requested by a `Retry-After` header, given as seconds or HTTP-date."""
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        initial_wait: float = 1.0,
+        max_wait: float = 60.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_attempts = max_attempts
+        self.initial_wait = initial_wait
+        self.max_wait = max_wait
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.circuit_breaker = circuit_breaker
+        self.sleep = sleep
+
+    def is_retryable(self, response: requests.Response) -> bool:
+        return response.status_code in self.retry_statuses
+
+    def wait(self, retry_state: tenacity.RetryCallState) -> float:
+        """
+        Exponential backoff with full jitter, at least as long as `Retry-After`.
+        `max_wait` caps the backoff only; retrying before the server asks for it fails anyway.
+        """
+        backoff = min(
+            self.max_wait, self.initial_wait * 2 ** (retry_state.attempt_number - 1)
+        )
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+        outcome = retry_state.outcome
+        response = None if outcome.failed else outcome.result()
+        requested = retry_after(response)
+        if requested is not None:
+            return max(backoff, requested)
+        return backoff
+
+    def _attempt(self, fn: Callable[[], requests.Response]) -> requests.Response:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+        try:
+            response = fn()
+        except RETRY_EXCEPTIONS:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
+            raise
+        except BaseException:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.release()
+            raise
+        if self.circuit_breaker is not None:
+            if self.is_retryable(response):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+        return response
+
+    @staticmethod
+    def _before_sleep(retry_state: tenacity.RetryCallState) -> None:
+        outcome = retry_state.outcome
+        if outcome.failed:
+            logging.debug(f"Attempt {retry_state.attempt_number}: {outcome.exception()!r}")
+        else:
+            response = outcome.result()
+            logging.debug(f"Attempt {retry_state.attempt_number}: HTTP {response.status_code}")
+            response.close()
+
+    def call(self, fn: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Calls `fn` until it returns a non-retryable response or attempts are exhausted.
+        Then returns the last response, or re-raises the last connection error.
+        """
+        retrying = tenacity.Retrying(
+            stop=tenacity.stop_after_attempt(self.max_attempts),
+            wait=self.wait,
+            retry=(
+                tenacity.retry_if_exception_type(RETRY_EXCEPTIONS)
+                | tenacity.retry_if_result(self.is_retryable)
+            ),
+            sleep=self.sleep,
+            before_sleep=self._before_sleep,
+            retry_error_callback=lambda state: state.outcome.result(),
+            reraise=True,
+        )
+        return retrying(self._attempt, fn)
+
+    def __call__(self, fn: Callable[[], requests.Response]) -> requests.Response:
+        return self.call(fn)
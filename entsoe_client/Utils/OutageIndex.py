@@ -0,0 +1,185 @@
+"""
+Point-in-time and window queries over outages parsed with `intervals=True`.
+
+Each row of such a frame is an availability segment `[start, end)`, its start being
+the index. `OutageIndex` keeps a centered interval tree over the segments:
+every node holds the segments containing its center, sorted by start and by end,
+hence a stabbing query visits O(log n) nodes and only reports matching segments.
+"""
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+BIDDING_ZONE = "TimeSeries.biddingZone_Domain.mRID"
+NOMINAL_POWER = "TimeSeries.production_RegisteredResource.pSRType.powerSystemResources.nominalP"
+
+
+def nanoseconds(timestamp) -> int:
+    """UTC nanoseconds; naive timestamps are taken as UTC."""
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    return timestamp.value
+
+
+def utc_timestamps(timestamps) -> pd.DatetimeIndex:
+    """UTC timestamps of nanosecond unit; naive timestamps are taken as UTC."""
+    timestamps = pd.DatetimeIndex(timestamps)
+    if timestamps.tz is None:
+        timestamps = timestamps.tz_localize("UTC")
+    return timestamps.as_unit("ns")
+
+
+def utc_nanoseconds(timestamps) -> np.ndarray:
+    return utc_timestamps(timestamps).asi8
+
+
+def unavailable_capacity(df: pd.DataFrame) -> np.ndarray:
+    """MW out of service per segment: nominal power less the available `quantity`."""
+    if NOMINAL_POWER not in df.columns:
+        raise ValueError(
+            f"Frame without `{NOMINAL_POWER}`, e.g. of transmission outages; pass `values`."
+        )
+    nominal = pd.to_numeric(df[NOMINAL_POWER].astype(object)).to_numpy(dtype=np.float64)
+    return np.clip(nominal - df["quantity"].to_numpy(dtype=np.float64), 0, None)
+
+
+def latest_revisions(df: pd.DataFrame) -> np.ndarray:
+    """Mask of the segments of the latest `revisionNumber` of each outage `mRID`."""
+    if "mRID" not in df.columns or "revisionNumber" not in df.columns:
+        return np.ones(len(df), dtype=bool)
+    revisions = pd.to_numeric(df["revisionNumber"].astype(object))
+    latest = revisions.groupby(df["mRID"].astype(object).to_numpy()).transform("max")
+    return (revisions == latest).to_numpy()
+
+
+class _Node:
+    __slots__ = ("center", "by_start", "starts", "by_end", "ends", "left", "right")
+
+    def __init__(self, center: int, by_start, starts, by_end, ends):
+        self.center = center
+        self.by_start, self.starts = by_start, starts  # Positions and starts, ascending.
+        self.by_end, self.ends = by_end, ends  # Positions and ends, ascending.
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+
+class OutageIndex:
+    """
+    Index over the segments of `frame`, an outage frame parsed with `intervals=True`.
+    Queries return rows of `frame` in frame order.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        if "end" not in frame.columns:
+            raise ValueError("Frame without `end`, parse outages with `intervals=True`.")
+        self.frame = frame
+        self.starts = utc_nanoseconds(frame.index)
+        self.ends = utc_nanoseconds(frame["end"])
+        positions = np.flatnonzero(self.ends > self.starts)  # Empty segments contain nothing.
+        self.order = positions[np.argsort(self.starts[positions], kind="stable")]
+        self.sorted_starts = self.starts[self.order]
+        self.root = self.build(positions)
+
+    def build(self, positions: np.ndarray) -> Optional[_Node]:
+        """Builds the tree of `positions` iteratively."""
+        root = None
+        stack = [(positions, None, None)]
+        while stack:
+            positions, parent, side = stack.pop()
+            if not positions.size:
+                continue
+            starts, ends = self.starts[positions], self.ends[positions]
+            # The lower median endpoint is a start or lies within a segment, hence
+            # neither side receives all positions.
+            endpoints = np.sort(np.concatenate([starts, ends]))
+            center = int(endpoints[(endpoints.size - 1) // 2])
+            left, right = ends <= center, starts > center
+            here = positions[~(left | right)]
+            by_start = here[np.argsort(self.starts[here], kind="stable")]
+            by_end = here[np.argsort(self.ends[here], kind="stable")]
+            node = _Node(center, by_start, self.starts[by_start], by_end, self.ends[by_end])
+            if parent is None:
+                root = node
+            else:
+                setattr(parent, side, node)
+            stack.append((positions[left], node, "left"))
+            stack.append((positions[right], node, "right"))
+        return root
+
+    def stab(self, t) -> np.ndarray:
+        """Positions of the segments containing `t`, i.e. `start <= t < end`, unordered."""
+        t = nanoseconds(t)
+        found: List[np.ndarray] = []
+        node = self.root
+        while node is not None:
+            if t < node.center:
+                found.append(node.by_start[: np.searchsorted(node.starts, t, side="right")])
+                node = node.left
+            else:
+                found.append(node.by_end[np.searchsorted(node.ends, t, side="right") :])
+                node = node.right
+        return np.concatenate(found) if found else np.zeros(0, dtype=np.int64)
+
+    def overlap(self, start, end) -> np.ndarray:
+        """Positions of the segments overlapping `[start, end)`, unordered."""
+        start, end = nanoseconds(start), nanoseconds(end)
+        if end <= start:
+            return np.zeros(0, dtype=np.int64)
+        # Segments containing `start`, and those starting within the window after it.
+        first = np.searchsorted(self.sorted_starts, start, side="right")
+        last = np.searchsorted(self.sorted_starts, end, side="left")
+        return np.concatenate([self.stab(start), self.order[first:last]])
+
+    def at(self, t) -> pd.DataFrame:
+        """Outages in effect at `t`."""
+        return self.frame.iloc[np.sort(self.stab(t))]
+
+    def between(self, start, end) -> pd.DataFrame:
+        """Outages in effect at any time of `[start, end)`."""
+        return self.frame.iloc[np.sort(self.overlap(start, end))]
+
+    def sweep(
+        self,
+        grid,
+        values: Union[str, np.ndarray, None] = None,
+        by: Optional[str] = BIDDING_ZONE,
+    ) -> Union[pd.DataFrame, pd.Series]:
+        """
+        Sum of `values` of the segments in effect at each timestamp of `grid`, per
+        distinct value of column `by`, or in total if `by` is None. `values` is a column
+        or an array of one value per segment; default `unavailable_capacity`.
+        Only the latest revision of each outage is summed, see `latest_revisions`.
+        Raises `ValueError` if a default column is missing, e.g. for transmission
+        outages, which have neither bidding zone nor nominal power.
+
+        Segments add their value at their start and remove it at their end; the sorted
+        events' cumulative sums are looked up for all grid timestamps at once.
+        """
+        if values is None:
+            values = unavailable_capacity(self.frame)
+        elif isinstance(values, str):
+            values = self.frame[values].to_numpy(dtype=np.float64)
+        if by is not None and by not in self.frame.columns:
+            raise ValueError(f"Frame without `{by}`; pass `by`, e.g. `TimeSeries.in_Domain.mRID`.")
+        values = np.nan_to_num(np.asarray(values, dtype=np.float64))
+        values = np.where(latest_revisions(self.frame), values, 0.0)
+        index = utc_timestamps(grid)
+        if by is None:
+            codes, groups = np.zeros(len(self.frame), dtype=np.int64), [None]
+        else:
+            codes, groups = pd.factorize(self.frame[by].astype(object), sort=True)
+        times = np.concatenate([self.starts, self.ends])
+        deltas = np.concatenate([values, -values])
+        codes = np.concatenate([codes, codes])
+        sums = np.zeros((len(index), len(groups)))
+        for code in range(len(groups)):
+            selected = codes == code
+            order = np.argsort(times[selected], kind="stable")
+            group_times = times[selected][order]
+            cumulative = np.append(0.0, np.cumsum(deltas[selected][order]))
+            sums[:, code] = cumulative[np.searchsorted(group_times, index.asi8, side="right")]
+        if by is None:
+            return pd.Series(sums[:, 0], index=index)
+        return pd.DataFrame(sums, index=index, columns=pd.Index(groups, name=by))
@@ -1 +1,3 @@
 from entsoe_client.Utils.ParameterEnum import ParameterEnum
+from entsoe_client.Utils.SingleFlight import SingleFlight
+from entsoe_client.Utils.OutageIndex import OutageIndex
@@ -1,7 +1,7 @@
 from . import Parsers, Queries
-from .Clients import Client
+from .Clients import AsyncClient, Client
 from .Parsers.Parser import Parser
 from .Queries.Query import Query
 
 __version__ = "0.2.4"
-__all__ = ["Client", "Query", "Parser", "Queries", "Parsers"]
+__all__ = ["Client", "AsyncClient", "Query", "Parser", "Queries", "Parsers"]
@@ -23,10 +23,8 @@ px = parser(client(px_query))
 import pandas as pd
 from entsoe_client import ParameterTypes
 
-df["quantity"] = df["quantity"].astype(float)
 resolution = "PT60M"
 px = px.query("`Period.resolution`==@resolution")
-px["price.amount"] = px["price.amount"].astype(float)
 
 consumption_mask = df["TimeSeries.outBiddingZone_Domain.mRID"].notna()
 production = df[~consumption_mask][["quantity", "TimeSeries.MktPSRType.psrType"]]
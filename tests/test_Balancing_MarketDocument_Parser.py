@@ -11,10 +11,10 @@ class test_Balancing_MarketDocument_Parser(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         cls.response_contents: dict = {}
-        # path = "./tests/data/Balancing_MarketDocument/"
-        # for file in os.listdir(path):
-        #     with open(path + file, "rb") as data:
-        #         cls.response_contents[file] = data.read()
+        path = os.path.join(os.path.dirname(__file__), "data", "Balancing_MarketDocument", "")
+        for file in os.listdir(path):
+            with open(path + file, "rb") as data:
+                cls.response_contents[file] = data.read()
 
     def test_dataloading(self):
         self.assertIsInstance(self.response_contents, dict)
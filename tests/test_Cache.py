@@ -0,0 +1,155 @@
+import io
+import os
+import tempfile
+import time
+import unittest
+from datetime import timedelta
+
+import pandas as pd
+import requests
+
+from entsoe_client import Client, Queries
+from entsoe_client.Cache import CachePolicy, ResponseCache, canonical_key
+from entsoe_client.ParameterTypes import *
+from entsoe_client.Parsers import Parser
+
+GL_DOCUMENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<GL_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0">
+    <mRID>1</mRID>
+    <type>A65</type>
+    <TimeSeries>
+        <mRID>1</mRID>
+        <quantity_Measure_Unit.name>MAW</quantity_Measure_Unit.name>
+        <Period>
+            <timeInterval>
+                <start>2016-01-01T00:00Z</start>
+                <end>2016-01-01T03:00Z</end>
+            </timeInterval>
+            <resolution>PT60M</resolution>
+            <Point>
+                <position>1</position>
+                <quantity>20.5</quantity>
+            </Point>
+            <Point>
+                <position>3</position>
+                <quantity>22.5</quantity>
+            </Point>
+        </Period>
+    </TimeSeries>
+</GL_MarketDocument>
+"""
+
+
+class CountingSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "text/xml"
+        response._content = GL_DOCUMENT
+        return response
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache.sqlite")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_canonical_key(self):
+        a = {"documentType": "A44", "periodStart": 201601010000, "mRID": None}
+        b = {"periodStart": 201601010000, "documentType": "A44", "securityToken": "x"}
+        self.assertEqual(canonical_key(a), canonical_key(b))
+        self.assertNotEqual(canonical_key(a), canonical_key({"documentType": "A65"}))
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(self.path, max_bytes=25)
+        response = ResponseCache.to_response(b"0123456789", "text/xml")
+        cache.put({"n": 1}, response)
+        cache.put({"n": 2}, response)
+        self.assertIsNotNone(cache.get({"n": 1}))  # 2 is now least recently used.
+        cache.put({"n": 3}, response)
+        self.assertIn({"n": 1}, cache)
+        self.assertNotIn({"n": 2}, cache)
+        self.assertIn({"n": 3}, cache)
+        self.assertLessEqual(cache.size(), 25)
+
+    def test_streamed_oversized_not_read(self):
+        class RecordingFile(io.BytesIO):
+            reads = 0
+
+            def read(self, *args):
+                RecordingFile.reads += 1
+                return super().read(*args)
+
+        cache = ResponseCache(self.path, max_bytes=25)
+        for content, cached in [(b"0" * 26, False), (b"0" * 25, True)]:
+            response = ResponseCache.to_response(b"", "text/xml")
+            response.fileobj = RecordingFile(content)
+            RecordingFile.reads = 0
+            cache.put({"n": len(content)}, response)
+            self.assertEqual({"n": len(content)} in cache, cached)
+            self.assertEqual(RecordingFile.reads, int(cached))
+            self.assertEqual(response.fileobj.tell(), 0)
+        self.assertEqual(cache.get({"n": 25}).content, b"0" * 25)
+
+    def test_client_serves_hits_without_network(self):
+        session = CountingSession()
+        client = Client("key", session=session, cache=ResponseCache(self.path))
+        query = Queries.Load.ActualTotalLoad(Area("CZ"), 201601010000, 201601010300)
+        first = Parser.parse(client.download(query))
+        cached_response = Client("other_key", session=session, cache=ResponseCache(self.path)).download(query)
+        second = Parser.parse(cached_response)
+        self.assertEqual(session.calls, 1)
+        self.assertTrue(cached_response.from_cache)
+        self.assertIsInstance(second, pd.DataFrame)
+        pd.testing.assert_frame_equal(first, second)
+
+
+class CachePolicyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        now = pd.Timestamp("2021-06-15T12:00Z").timestamp()
+        self.policy = CachePolicy(clock=lambda: now)
+
+    def test_settled_prices_never_expire(self):
+        params = {"documentType": "A44", "periodStart": 202001010000, "periodEnd": 202101010000}
+        self.assertIsNone(self.policy.ttl(params))
+
+    def test_volatile_tail(self):
+        params = {"documentType": "A69", "periodStart": 202106150000, "periodEnd": 202106160000}
+        self.assertEqual(self.policy.ttl(params), 900.0)
+        params = {"documentType": "A65", "periodStart": 202106010000, "periodEnd": 202106120000}
+        self.assertEqual(self.policy.ttl(params), 900.0)  # Actuals settle after a week.
+
+    def test_outages_are_revisable(self):
+        params = {"documentType": "A80", "periodStart": 201601010000, "periodEnd": 201701010000}
+        self.assertEqual(self.policy.ttl(params), self.policy.revisable_ttl)
+        self.assertIsNone(self.policy.settled_before("A80"))
+
+    def test_override(self):
+        policy = CachePolicy(settles_after={"A44": timedelta(days=400)}, clock=self.policy.clock)
+        params = {"documentType": "A44", "periodEnd": 202101010000}
+        self.assertEqual(policy.ttl(params), 3600.0)
+
+    def test_cache_expiry(self):
+        with tempfile.TemporaryDirectory() as directory:
+            policy = CachePolicy(volatile_ttl={"A69": 0.05})
+            cache = ResponseCache(os.path.join(directory, "cache.sqlite"), policy=policy)
+            response = ResponseCache.to_response(b"<xml/>", "text/xml")
+            tail = {"documentType": "A69", "periodEnd": 209901010000}
+            history = {"documentType": "A44", "periodEnd": 201601010000}
+            cache.put(tail, response)
+            cache.put(history, response)
+            self.assertIn(tail, cache)
+            time.sleep(0.1)
+            self.assertIsNone(cache.get(tail))
+            self.assertIsNotNone(cache.get(history))
+
+
+if __name__ == "__main__":
+    unittest.main()
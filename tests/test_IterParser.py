@@ -0,0 +1,62 @@
+import io
+import os
+import unittest
+
+import pandas as pd
+
+from entsoe_client.Parsers import XMLParser
+from entsoe_client.Parsers.IterParser import IterParser, UnsupportedDocument
+from entsoe_client.Parsers.Parser import factory
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+ACKNOWLEDGEMENT = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Acknowledgement_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-1:acknowledgementdocument:7:0">
+    <mRID>1</mRID>
+    <createdDateTime>2021-10-01T00:00:00Z</createdDateTime>
+    <Reason>
+        <code>999</code>
+        <text>No matching data found</text>
+    </Reason>
+</Acknowledgement_MarketDocument>
+"""
+
+
+class test_IterParser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.response_contents: dict = {}
+        for document in ["GL_MarketDocument", "Publication_MarketDocument", "Balancing_MarketDocument"]:
+            path = os.path.join(DATA, document)
+            for file in os.listdir(path):
+                with open(os.path.join(path, file), "rb") as data:
+                    cls.response_contents[file] = data.read()
+
+    def test_equals_objectify_parser(self):
+        for file, response_content in self.response_contents.items():
+            with self.subTest(file=file):
+                expected = XMLParser().parse(response_content)
+                df = IterParser(factory).parse(response_content)
+                pd.testing.assert_frame_equal(df, expected)
+
+    def test_file_input(self):
+        for file, response_content in self.response_contents.items():
+            with self.subTest(file=file):
+                df = IterParser(factory).parse(io.BytesIO(response_content))
+                pd.testing.assert_frame_equal(df, XMLParser().parse(response_content))
+
+    def test_unsupported_document(self):
+        with self.assertRaises(UnsupportedDocument):
+            IterParser(factory).parse(ACKNOWLEDGEMENT)
+
+    def test_engine_falls_back_to_objectify(self):
+        df = XMLParser(engine="iterparse").parse(io.BytesIO(ACKNOWLEDGEMENT))
+        pd.testing.assert_frame_equal(df, XMLParser().parse(ACKNOWLEDGEMENT))
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            XMLParser(engine="sax")
+
+
+if __name__ == "__main__":
+    unittest.main()
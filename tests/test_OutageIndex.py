@@ -0,0 +1,105 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from entsoe_client.Parsers import XMLParser
+from entsoe_client.Utils.OutageIndex import (BIDDING_ZONE, NOMINAL_POWER,
+                                             OutageIndex)
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+def random_outages(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp("2021-01-01T00:00Z")
+    starts = start + pd.to_timedelta(rng.integers(0, 24 * 30, n), unit="h")
+    ends = starts + pd.to_timedelta(rng.integers(0, 24 * 7, n), unit="h")
+    return pd.DataFrame(
+        {
+            "end": ends,
+            "quantity": rng.integers(0, 100, n).astype(float),
+            BIDDING_ZONE: pd.Categorical(rng.choice(["10YDE", "10YFR", "10YPL"], n)),
+            NOMINAL_POWER: pd.Categorical(rng.choice(["100", "250"], n)),
+        },
+        index=starts,
+    )
+
+
+class OutageIndexTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.df = random_outages(500)
+        cls.index = OutageIndex(cls.df)
+        cls.times = pd.date_range("2020-12-31T12:00Z", "2021-02-10T00:00Z", freq="7h")
+
+    def test_stab_equals_scan(self):
+        for t in self.times:
+            expected = np.flatnonzero((self.df.index <= t) & (self.df["end"] > t))
+            np.testing.assert_array_equal(np.sort(self.index.stab(t)), expected)
+        self.assertEqual(len(self.index.at(self.times[100])), len(self.index.stab(self.times[100])))
+
+    def test_overlap_equals_scan(self):
+        for start, end in zip(self.times[:-3], self.times[3:]):
+            expected = np.flatnonzero(
+                (self.df.index < end) & (self.df["end"] > start) & (self.df["end"] > self.df.index)
+            )
+            np.testing.assert_array_equal(np.sort(self.index.overlap(start, end)), expected)
+        self.assertEqual(len(self.index.overlap(self.times[5], self.times[5])), 0)
+
+    def test_sweep_equals_scan(self):
+        unavailable = self.df[NOMINAL_POWER].astype(float) - self.df["quantity"]
+        sums = self.index.sweep(self.times)
+        self.assertEqual(list(sums.columns), ["10YDE", "10YFR", "10YPL"])
+        for t in self.times[::10]:
+            active = (self.df.index <= t) & (self.df["end"] > t)
+            expected = unavailable[active].groupby(self.df[BIDDING_ZONE][active], observed=False).sum()
+            np.testing.assert_allclose(sums.loc[t], expected.reindex(sums.columns).to_numpy(), atol=1e-9)
+        total = self.index.sweep(self.times, values="quantity", by=None)
+        t = self.times[50]
+        active = (self.df.index <= t) & (self.df["end"] > t)
+        self.assertAlmostEqual(total[t], self.df["quantity"][active].sum())
+
+    def test_parsed_outages(self):
+        path = os.path.join(
+            DATA, "Unavailability_MarketDocument", "A78_UnavailabilityOfTransmissionInfrastructure.xml"
+        )
+        with open(path, "rb") as data:
+            response_content = data.read()
+        df = XMLParser(intervals=True).parse(response_content)
+        index = OutageIndex(df)
+        self.assertEqual(list(index.at("2021-08-24T10:00Z")["quantity"]), [350.0])
+        self.assertEqual(len(index.between("2021-08-24T08:00Z", "2021-08-24T10:00Z")), 2)
+        self.assertEqual(len(index.at("2021-08-24T14:00Z")), 0)
+        with self.assertRaises(ValueError):
+            OutageIndex(XMLParser().parse(response_content))
+
+    def test_sweep_transmission_outages(self):
+        path = os.path.join(
+            DATA, "Unavailability_MarketDocument", "A78_UnavailabilityOfTransmissionInfrastructure.xml"
+        )
+        with open(path, "rb") as data:
+            index = OutageIndex(XMLParser(intervals=True).parse(data.read()))
+        grid = pd.date_range("2021-08-24T06:00Z", "2021-08-24T14:00Z", freq="1h")
+        with self.assertRaises(ValueError):
+            index.sweep(grid)
+        with self.assertRaises(ValueError):
+            index.sweep(grid, values="quantity")
+        sums = index.sweep(grid, values="quantity", by="TimeSeries.in_Domain.mRID")
+        self.assertEqual(list(sums["10YDE-VE-------2"]), [500.0] * 3 + [350.0] * 5 + [0.0])
+
+    def test_sweep_latest_revision(self):
+        df = random_outages(2).assign(
+            mRID=["outage", "outage"], revisionNumber=["1", "2"]
+        )
+        df.index = pd.DatetimeIndex([pd.Timestamp("2021-01-01T00:00Z")] * 2)
+        df["end"] = pd.Timestamp("2021-01-02T00:00Z")
+        df["quantity"] = [0.0, 50.0]
+        df[NOMINAL_POWER] = "100"
+        total = OutageIndex(df).sweep(["2021-01-01T12:00Z"], by=None)
+        self.assertEqual(list(total), [50.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,318 @@
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+import requests
+
+from entsoe_client.Parsers import ParserUtils as utils
+from entsoe_client.Parsers import Parser, XMLParser
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+class DocumentToDataFrameTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.response_contents: dict = {}
+        for document in ["GL_MarketDocument", "Publication_MarketDocument", "Balancing_MarketDocument"]:
+            path = os.path.join(DATA, document)
+            for file in os.listdir(path):
+                with open(os.path.join(path, file), "rb") as data:
+                    cls.response_contents[file] = data.read()
+
+    def test_equals_nested_tree_parser(self):
+        tree_parser = utils.Tree_to_DataFrame(
+            utils.Tree_to_DataFrame(utils.StandardPeriodParser, "Period"), "TimeSeries"
+        )
+        for file, response_content in self.response_contents.items():
+            with self.subTest(file=file):
+                root = XMLParser.deserialize_xml(response_content)
+                expected = tree_parser(root)
+                for column in expected.columns:
+                    if column == "position":
+                        expected[column] = expected[column].astype("int64")
+                    elif column in ["quantity", "price.amount"]:
+                        expected[column] = expected[column].astype("float64")
+                    elif utils.is_timestamp_field(column):
+                        expected[column] = pd.to_datetime(expected[column], utc=True)
+                pd.testing.assert_frame_equal(
+                    utils.StandardDocumentParser(root, categorical=False), expected
+                )
+
+    def test_gaps_are_filled(self):
+        root = XMLParser.deserialize_xml(
+            self.response_contents["A75_AggregatedGenerationPerType.xml"]
+        )
+        Period = utils.child_elements(utils.child_elements(root, tag="TimeSeries")[1], tag="Period")[0]
+        columns = utils.get_Period_columns(Period, length=8)
+        self.assertEqual(list(columns["position"]), [str(i) for i in range(1, 9)])
+        self.assertEqual(list(columns["quantity"]), ["120"] * 3 + ["80"] + ["0"] * 4)
+        records = utils.records_to_columns(utils.get_Period_data(Period, length=8))
+        for field, values in columns.items():
+            np.testing.assert_array_equal(records[field], values)
+
+    def test_price_gaps_are_filled(self):
+        df = XMLParser().parse(self.response_contents["A44_DayAheadPrices.xml"])
+        self.assertEqual(len(df), 24)
+        self.assertEqual(list(df["position"]), list(range(1, 25)))
+        self.assertEqual(list(df["price.amount"].iloc[1:5]), [80.02] * 3 + [74.5])
+        self.assertEqual(df["price.amount"].iloc[-1], 110.03)
+
+    def test_typed_columns(self):
+        df = XMLParser().parse(self.response_contents["A61_ForecastedCapacity.xml"])
+        self.assertEqual(df["position"].dtype, np.int64)
+        self.assertEqual(df["quantity"].dtype, np.float64)
+        self.assertEqual(df["TimeSeries.mRID"].dtype, "category")
+        self.assertEqual(df["Period.timeInterval.start"].dtype, "datetime64[ns, UTC]")
+        self.assertEqual(
+            df["Publication_MarketDocument.createdDateTime"].iloc[0],
+            pd.Timestamp("2021-10-01T08:12:00Z"),
+        )
+        df = XMLParser(float_dtype=np.float32).parse(
+            self.response_contents["A61_ForecastedCapacity.xml"]
+        )
+        self.assertEqual(df["quantity"].dtype, np.float32)
+
+    def test_categorical_metadata(self):
+        root = XMLParser.deserialize_xml(
+            self.response_contents["A75_AggregatedGenerationPerType.xml"]
+        )
+        df = utils.StandardDocumentParser(root)
+        strings = utils.StandardDocumentParser(root, categorical=False)
+        self.assertEqual(df["TimeSeries.MktPSRType.psrType"].dtype, "category")
+        self.assertEqual(list(df["TimeSeries.MktPSRType.psrType"].cat.categories), ["B01", "B10"])
+        pd.testing.assert_frame_equal(df.astype(strings.dtypes), strings)
+        self.assertLess(
+            df.memory_usage(deep=True).sum(), strings.memory_usage(deep=True).sum()
+        )
+
+    def test_concat_documents_unites_categories(self):
+        first = pd.DataFrame({"a": pd.Categorical(["x", "y"]), "b": pd.Categorical(["z", "z"])})
+        second = pd.DataFrame({"a": pd.Categorical(["w"])})
+        df = utils.concat_documents([first, second])
+        self.assertEqual(df["a"].dtype, "category")
+        self.assertEqual(list(df["a"]), ["x", "y", "w"])
+        self.assertEqual(df["b"].dtype, "category")
+        self.assertEqual(df["b"].isna().sum(), 1)
+
+
+class TablesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        path = os.path.join(DATA, "GL_MarketDocument", "A75_AggregatedGenerationPerType.xml")
+        with open(path, "rb") as data:
+            cls.response_content = data.read()
+
+    def test_join_equals_wide_frame(self):
+        wide = XMLParser(categorical=False).parse(self.response_content)
+        for engine in ["objectify", "iterparse"]:
+            with self.subTest(engine=engine):
+                tables = XMLParser(engine=engine, normalized=True).parse(self.response_content)
+                self.assertIsInstance(tables, utils.Tables)
+                self.assertEqual(
+                    list(tables.values.columns), ["series_id", "timestamp", "position", "quantity"]
+                )
+                self.assertEqual(tables.values["series_id"].dtype, np.int32)
+                self.assertEqual(len(tables.series), tables.values["series_id"].nunique())
+                joined = tables.values.join(tables.series, on="series_id")
+                np.testing.assert_array_equal(joined["timestamp"], wide.index)
+                for column in wide.columns:
+                    pd.testing.assert_series_equal(
+                        joined[column], wide[column].reset_index(drop=True), check_names=False
+                    )
+
+    def test_parse_many_merges_repeated_series(self):
+        response = requests.Response()
+        response.headers["Content-Type"] = "text/xml"
+        response._content = self.response_content
+        once = XMLParser(normalized=True).parse(self.response_content)
+        tables = Parser.parse_many([response, response], normalized=True)
+        pd.testing.assert_frame_equal(tables.series, once.series)
+        pd.testing.assert_frame_equal(tables.values, once.values)
+
+
+class PeriodIndexTest(unittest.TestCase):
+    def test_equals_date_range(self):
+        for start, end, resolution in [
+            ("2021-01-01T00:00Z", "2021-01-02T00:00Z", "PT15M"),
+            ("2021-03-27T23:00Z", "2021-03-28T22:00Z", "PT60M"),
+            ("2021-01-01T00:00Z", "2021-01-01T02:50Z", "PT30M"),
+            ("2021-01-01T00:00Z", "2021-01-01T00:10Z", "PT60M"),
+            ("2021-01-01T00:00Z", "2021-02-01T00:00Z", "P1D"),
+            ("2021-01-04T00:00Z", "2021-02-01T00:00Z", "P7D"),
+        ]:
+            with self.subTest(resolution=resolution, end=end):
+                expected = pd.date_range(start, end, freq=utils.resolution_map[resolution])
+                expected = expected[:-1] if expected.size > 1 else expected
+                pd.testing.assert_index_equal(
+                    utils.Period_index(start, end, resolution), expected, exact=False
+                )
+
+    def test_calendar_resolutions(self):
+        index = utils.Period_index("2020-12-31T23:00Z", "2021-12-31T23:00Z", "P1M")
+        self.assertEqual(len(index), 12)
+        self.assertEqual(index[1], pd.Timestamp("2021-01-31T23:00Z"))
+        self.assertEqual(index[-1], pd.Timestamp("2021-11-30T23:00Z"))
+        index = utils.Period_index("2015-12-31T23:00Z", "2020-12-31T23:00Z", "P1Y")
+        self.assertEqual(list(index.year), [2015, 2016, 2017, 2018, 2019])
+
+    def test_memoized(self):
+        timestamps = utils.Period_timestamps("2021-01-01T00:00Z", "2021-01-02T00:00Z", "PT60M")
+        self.assertIs(
+            utils.Period_timestamps("2021-01-01T00:00Z", "2021-01-02T00:00Z", "PT60M"), timestamps
+        )
+        self.assertFalse(timestamps.flags.writeable)
+
+
+class OutageIntervalsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        path = os.path.join(
+            DATA, "Unavailability_MarketDocument", "A78_UnavailabilityOfTransmissionInfrastructure.xml"
+        )
+        with open(path, "rb") as data:
+            cls.response_content = data.read()
+
+    def test_segments(self):
+        df = XMLParser(intervals=True).parse(self.response_content)
+        self.assertEqual(list(df.columns[:4]), ["end", "quantity", "mRID", "revisionNumber"])
+        self.assertEqual(list(df.index), list(pd.to_datetime(["2021-08-24T06:00Z", "2021-08-24T09:00Z"])))
+        self.assertEqual(list(df["end"]), list(pd.to_datetime(["2021-08-24T09:00Z", "2021-08-24T14:00Z"])))
+        self.assertEqual(list(df["quantity"]), [500.0, 350.0])
+        points = XMLParser().parse(self.response_content)
+        metadata = points.columns[2:]
+        pd.testing.assert_frame_equal(
+            df[metadata].reset_index(drop=True), points[metadata].reset_index(drop=True)
+        )
+
+    def test_rows_scale_with_changes(self):
+        points = "".join(
+            f"<Point><position>{i}</position><quantity>{500 if i < 600 else 0}</quantity></Point>"
+            for i in range(1, 481 + 60 * 24 * 30)
+        )
+        content = (
+            self.response_content.replace(b"PT60M", b"PT1M")
+            .replace(b"2021-08-24T14:00Z", b"2021-09-24T14:00Z")
+        )
+        start, end = content.index(b"<Point>"), content.rindex(b"</Point>") + len(b"</Point>")
+        content = content[:start] + points.encode() + content[end:]
+        df = XMLParser(intervals=True).parse(content)
+        self.assertEqual(list(df["quantity"]), [500.0, 0.0])
+        self.assertEqual(df.index[1], pd.Timestamp("2021-08-24T06:00Z") + pd.Timedelta(minutes=599))
+        self.assertEqual(df["end"].iloc[-1], pd.Timestamp("2021-09-24T14:00Z"))
+
+
+class OutageAssetsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        path = os.path.join(
+            DATA, "Unavailability_MarketDocument", "A78_UnavailabilityOfTransmissionInfrastructure.xml"
+        )
+        with open(path, "rb") as data:
+            cls.response_content = data.read()
+
+    def test_assets_join_series(self):
+        wide = XMLParser(categorical=False).parse(self.response_content)
+        tables = XMLParser(normalized=True).parse(self.response_content)
+        self.assertEqual(
+            list(tables.assets.columns),
+            ["series_id", "mRID", "name", "asset_PSRType.psrType", "location.name"],
+        )
+        self.assertEqual(list(tables.assets["name"]), ["Line A", "Line B"])
+        self.assertFalse(any(column.startswith("Asset_") for column in tables.series.columns))
+        self.assertEqual(tables.series.loc[0, "mRID"], "bD1LfDyMQRwKqo6J1p0ZTg")
+        joined = tables.assets.groupby("series_id", observed=True)["mRID"].agg(lambda ids: ", ".join(ids))
+        self.assertEqual(joined[0], wide["Asset_RegisteredResource.mRID"].iloc[0])
+
+    def test_parse_many_renumbers_assets(self):
+        other = self.response_content.replace(b"bD1LfDyMQRwKqo6J1p0ZTg", b"other").replace(
+            b"Line B", b"Line C"
+        )
+        responses = []
+        for content in [self.response_content, other, self.response_content]:
+            response = requests.Response()
+            response.headers["Content-Type"] = "text/xml"
+            response._content = content
+            responses.append(response)
+        tables = Parser.parse_many(responses, normalized=True)
+        self.assertEqual(list(tables.series["mRID"]), ["bD1LfDyMQRwKqo6J1p0ZTg", "other"])
+        self.assertEqual(list(tables.assets["series_id"]), [0, 0, 1, 1])
+        self.assertEqual(list(tables.assets["name"]), ["Line A", "Line B", "Line A", "Line C"])
+        self.assertEqual(len(tables.values), 4)
+
+
+class CheckPeriodDataMissingTest(unittest.TestCase):
+    def test_fills_forward(self):
+        data = [
+            {"position": "4", "quantity": "80"},
+            {"position": "1", "quantity": "120", "secondaryQuantity": "1"},
+            {"position": "5", "quantity": "0"},
+        ]
+        self.assertEqual(
+            utils.check_period_data_missing(data),
+            [
+                {"position": "1", "quantity": "120", "secondaryQuantity": "1"},
+                {"position": "2", "quantity": "120", "secondaryQuantity": "1"},
+                {"position": "3", "quantity": "120", "secondaryQuantity": "1"},
+                {"position": "4", "quantity": "80"},
+                {"position": "5", "quantity": "0"},
+            ],
+        )
+
+    def test_leading_gap_has_no_values(self):
+        data = utils.check_period_data_missing([{"position": "3", "price.amount": "1.0"}])
+        self.assertEqual(data[:2], [{"position": "1"}, {"position": "2"}])
+
+    def test_fill_Period_columns(self):
+        columns = {
+            "position": np.array(["2", "5"], dtype=object),
+            "quantity": np.array(["7", "9"], dtype=object),
+        }
+        filled = utils.fill_Period_columns(columns, length=6)
+        self.assertEqual(list(filled["position"]), ["1", "2", "3", "4", "5", "6"])
+        self.assertTrue(pd.isna(filled["quantity"][0]))
+        self.assertEqual(list(filled["quantity"][1:]), ["7", "7", "7", "9", "9"])
+
+
+class ColumnBuilderTest(unittest.TestCase):
+    def test_grows_beyond_capacity(self):
+        builder = utils.ColumnBuilder(capacity=1)
+        index = pd.date_range("2021-01-01", periods=3, freq="1h", tz="UTC")
+        for i in range(3):
+            builder.append_Period(
+                index + pd.Timedelta(hours=3 * i),
+                {"position": np.array(["1", "2", "3"], dtype=object)},
+                {"Period.resolution": "PT60M"},
+            )
+        builder.end_TimeSeries({"TimeSeries.mRID": "1"})
+        df = builder.to_frame({"GL_MarketDocument.type": "A75"})
+        self.assertEqual(len(df), 9)
+        self.assertEqual(df["position"].dtype, np.int64)
+        self.assertEqual(
+            list(df.columns),
+            ["position", "Period.resolution", "TimeSeries.mRID", "GL_MarketDocument.type"],
+        )
+        self.assertTrue((df["TimeSeries.mRID"] == "1").all())
+        self.assertEqual(df["TimeSeries.mRID"].dtype, "category")
+
+    def test_missing_columns_are_nan(self):
+        builder = utils.ColumnBuilder()
+        index = pd.date_range("2021-01-01", periods=2, freq="1h", tz="UTC")
+        builder.append_Period(index, {"quantity": np.array(["1", "2"], dtype=object)}, {})
+        builder.end_TimeSeries({"TimeSeries.mRID": "1"})
+        builder.append_Period(index, {"price.amount": np.array(["3", "4"], dtype=object)}, {})
+        builder.end_TimeSeries({"TimeSeries.mRID": "2"})
+        df = builder.to_frame({})
+        self.assertEqual(list(df.columns), ["quantity", "TimeSeries.mRID", "price.amount"])
+        self.assertEqual(df["quantity"].isna().sum(), 2)
+        self.assertEqual(df["quantity"].dtype, np.float64)
+        self.assertEqual(df["price.amount"].isna().sum(), 2)
+
+    def test_document_without_period(self):
+        with self.assertRaises(ValueError):
+            utils.ColumnBuilder().to_frame({})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import pandas as pd
+
 import entsoe_client
 from entsoe_client.ParameterTypes import *
 
@@ -16,6 +18,37 @@ class QueryTest(unittest.TestCase):
         )
         self.assertEqual(q.periodStart, 202101010100)
 
+    def test_split_range_limit(self):
+        q = entsoe_client.Queries.Load.ActualTotalLoad(
+            outBiddingZone_Domain=Area("DE_LU"),
+            periodStart=201512312300,
+            periodEnd=201912312300,
+        )
+        chunks = q.split()
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(chunks[0].periodStart, 201512312300)
+        self.assertEqual(chunks[-1].periodEnd, 201912312300)
+        for previous, following in zip(chunks, chunks[1:]):
+            self.assertEqual(previous.periodEnd, following.periodStart)
+        self.assertEqual(chunks[1]()["documentType"], q()["documentType"])
+        self.assertEqual(q.periodEnd, 201912312300)
+
+    def test_split_boundaries(self):
+        q = entsoe_client.Query(periodStart=202101010000, periodEnd=202101100000)
+        self.assertEqual(q.split(), [q])
+        chunks = q.split(
+            range_limit=pd.DateOffset(days=4),
+            boundaries=[pd.Timestamp("2021-01-06T12:00Z"), pd.Timestamp("2022-01-01T00:00Z")],
+        )
+        self.assertEqual(
+            [(c.periodStart, c.periodEnd) for c in chunks],
+            [
+                (202101010000, 202101050000),
+                (202101050000, 202101061200),
+                (202101061200, 202101100000),
+            ],
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=101)
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import requests
+
+from entsoe_client import Client
+from entsoe_client.RateLimiter import SQLiteTokenBucket, TokenBucket
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_throttle(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, capacity=4, clock=clock, sleep=clock.sleep)
+        for _ in range(4):
+            bucket.acquire()
+        self.assertEqual(clock.slept, [])
+        bucket.acquire()
+        self.assertAlmostEqual(sum(clock.slept), 0.5)
+
+    def test_refill_capped(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+        clock.now += 3600
+        self.assertEqual(bucket.try_acquire(2), 0.0)
+        self.assertAlmostEqual(bucket.try_acquire(1), 1.0)
+
+    def test_per_minute(self):
+        bucket = TokenBucket.per_minute(120)
+        self.assertAlmostEqual(bucket.rate, 2.0)
+
+    def test_threads_share_bucket(self):
+        clock = FakeClock()
+        lock = threading.Lock()
+
+        def sleep(seconds):
+            with lock:
+                clock.sleep(seconds)
+
+        bucket = TokenBucket(rate=10.0, capacity=1, clock=clock, sleep=sleep)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(clock.now - 1000.0, 1.0 - 1e-9)
+
+    def test_client_acquires(self):
+        calls = []
+
+        class Limiter(TokenBucket):
+            def acquire(self, tokens=1):
+                calls.append(tokens)
+
+        class Session:
+            def get(self, **kwargs):
+                response = requests.Response()
+                response.status_code = 200
+                return response
+
+        client = Client("key", session=Session(), rate_limiter=Limiter(rate=1.0))
+        client._request({})
+        self.assertEqual(calls, [1])
+
+
+class SQLiteTokenBucketTest(unittest.TestCase):
+    def test_shared_state(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bucket.sqlite")
+            clock = FakeClock()
+            first = SQLiteTokenBucket(path, rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+            second = SQLiteTokenBucket(path, rate=1.0, capacity=2, clock=clock, sleep=clock.sleep)
+            self.assertEqual(first.try_acquire(), 0.0)
+            self.assertEqual(second.try_acquire(), 0.0)
+            self.assertAlmostEqual(first.try_acquire(), 1.0)
+            second.acquire()
+            self.assertAlmostEqual(sum(clock.slept), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
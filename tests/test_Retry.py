@@ -0,0 +1,204 @@
+import io
+import threading
+import time
+import unittest
+
+import requests
+
+from entsoe_client import Client
+from entsoe_client.Retry import CircuitBreaker, CircuitOpenError, RetryPolicy, retry_after
+
+
+def response(status_code: int, headers: dict = None) -> requests.Response:
+    r = requests.Response()
+    r.status_code = status_code
+    r.headers.update(headers or {})
+    r._content = b""
+    r.raw = io.BytesIO()
+    return r
+
+
+class ScriptedSession:
+    """Returns (or raises) the scripted outcomes in order."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, **kwargs):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+
+    def client(self, outcomes, **kwargs):
+        policy = RetryPolicy(sleep=self.clock.sleep, **kwargs)
+        session = ScriptedSession(outcomes)
+        return Client("key", session=session, retry_policy=policy), session
+
+    def test_retries_transient_failures(self):
+        client, session = self.client(
+            [requests.exceptions.ConnectionError(), response(503), response(200)]
+        )
+        self.assertEqual(client._request({}).status_code, 200)
+        self.assertEqual(session.calls, 3)
+        self.assertEqual(len(self.clock.slept), 2)
+
+    def test_no_retry_on_client_errors(self):
+        client, session = self.client([response(400), response(200)])
+        self.assertEqual(client._request({}).status_code, 400)
+        self.assertEqual(session.calls, 1)
+
+    def test_exhausted(self):
+        client, session = self.client([response(429)] * 3, max_attempts=3)
+        self.assertEqual(client._request({}).status_code, 429)
+        client, session = self.client([requests.exceptions.Timeout()] * 2, max_attempts=2)
+        with self.assertRaises(requests.exceptions.Timeout):
+            client._request({})
+
+    def test_retry_after(self):
+        client, session = self.client(
+            [response(429, {"Retry-After": "7"}), response(200)], jitter=False
+        )
+        client._request({})
+        self.assertEqual(self.clock.slept, [7.0])
+        self.assertEqual(retry_after(response(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})), 0.0)
+        self.assertIsNone(retry_after(response(429)))
+
+    def test_retry_after_exceeds_max_wait(self):
+        client, session = self.client(
+            [response(503, {"Retry-After": "120"}), response(503), response(200)],
+            jitter=False,
+            max_wait=10.0,
+        )
+        client._request({})
+        self.assertEqual(self.clock.slept, [120.0, 2.0])
+
+    def test_exponential_backoff(self):
+        client, session = self.client(
+            [response(500)] * 4 + [response(200)], max_attempts=5, jitter=False, max_wait=5.0
+        )
+        client._request({})
+        self.assertEqual(self.clock.slept, [1.0, 2.0, 4.0, 5.0])
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_opens_and_recovers(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_threshold=2, reset_timeout=30.0, clock=clock, sleep=clock.sleep
+        )
+        breaker.record_failure()
+        self.assertFalse(breaker.is_open)
+        breaker.record_failure()
+        self.assertTrue(breaker.is_open)
+        breaker.before_request()
+        self.assertEqual(clock.slept, [30.0])
+        breaker.record_failure()  # Failed probe re-opens.
+        self.assertTrue(breaker.is_open)
+        clock.now += 30.0
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertFalse(breaker.is_open)
+
+    def test_non_blocking(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, block=False, clock=clock)
+        breaker.record_failure()
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request()
+
+    def run_half_open(self, breaker: CircuitBreaker, probe_outcomes, n: int = 5):
+        """Starts `n` threads once the circuit is open; the first to pass reports `probe_outcomes`."""
+        events, lock = [], threading.Lock()
+        outcomes = list(probe_outcomes)
+
+        def request():
+            breaker.before_request()
+            with lock:
+                events.append("pass")
+                outcome = outcomes.pop(0) if outcomes else None
+            if outcome is None:
+                breaker.record_success()
+                return
+            time.sleep(0.1)
+            with lock:
+                events.append(outcome)
+            if outcome == "success":
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+
+        threads = [threading.Thread(target=request) for _ in range(n)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        return events
+
+    def test_half_open_single_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        events = self.run_half_open(breaker, ["success"])
+        self.assertEqual(events, ["pass", "success"] + ["pass"] * 4)
+
+    def test_half_open_failed_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        events = self.run_half_open(breaker, ["failure", "success"])
+        self.assertEqual(events, ["pass", "failure", "pass", "success"] + ["pass"] * 3)
+
+    def test_half_open_non_blocking(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30.0, block=False, clock=clock)
+        breaker.record_failure()
+        clock.now += 30.0
+        breaker.before_request()  # Probe.
+        errors = []
+
+        def other_request():
+            try:
+                breaker.before_request()
+            except CircuitOpenError as e:
+                errors.append(e)
+
+        other = threading.Thread(target=other_request)
+        other.start()
+        other.join()
+        self.assertEqual(len(errors), 1)
+        breaker.release()
+        breaker.before_request()  # The next request probes instead.
+        breaker.record_success()
+        breaker.before_request()
+
+    def test_shared_by_policy(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0, clock=clock, sleep=clock.sleep)
+        policy = RetryPolicy(max_attempts=3, jitter=False, circuit_breaker=breaker, sleep=clock.sleep)
+        session = ScriptedSession([response(503), response(503), response(200)])
+        client = Client("key", session=session, retry_policy=policy)
+        self.assertEqual(client._request({}).status_code, 200)
+        self.assertGreaterEqual(clock.now, 61.0)  # Opened after the second failure at t=1.
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import unittest
+
+import pandas as pd
+import requests
+
+from entsoe_client.Parsers import Parser, Sinks, XMLParser
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+def response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.headers["Content-Type"] = "text/xml"
+    response._content = content
+    return response
+
+
+class test_Sinks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        path = os.path.join(DATA, "GL_MarketDocument", "A75_AggregatedGenerationPerType.xml")
+        with open(path, "rb") as data:
+            cls.response_content = data.read()
+        cls.expected = Sinks.index_as_column(XMLParser().parse(cls.response_content))
+
+    def assert_equals_pandas(self, df: pd.DataFrame):
+        self.assertEqual(list(df.columns), list(self.expected.columns))
+        for column in self.expected.columns:
+            pd.testing.assert_series_equal(
+                df[column], self.expected[column], check_dtype=False, check_categorical=False
+            )
+
+    def test_pandas_is_default(self):
+        df = XMLParser(sink="pandas").parse(self.response_content)
+        pd.testing.assert_frame_equal(Sinks.index_as_column(df), self.expected)
+
+    def test_unknown_sink(self):
+        with self.assertRaises(ValueError):
+            XMLParser(sink="unknown").parse(self.response_content)
+
+    @unittest.skipIf(Sinks.pa is None, "pyarrow is not installed")
+    def test_pyarrow(self):
+        pa = Sinks.pa
+        for engine in ["objectify", "iterparse"]:
+            with self.subTest(engine=engine):
+                table = XMLParser(engine=engine, sink="pyarrow").parse(self.response_content)
+                self.assertIsInstance(table, pa.Table)
+                self.assertEqual(table.schema.field("timestamp").type, pa.timestamp("ns", tz="UTC"))
+                self.assertTrue(pa.types.is_dictionary(table.schema.field("TimeSeries.mRID").type))
+                self.assert_equals_pandas(table.to_pandas())
+        table = Parser.parse_many([response(self.response_content)] * 2, sink="pyarrow")
+        self.assert_equals_pandas(table.to_pandas())
+
+    @unittest.skipIf(Sinks.pl is None, "polars is not installed")
+    def test_polars(self):
+        pl = Sinks.pl
+        for engine in ["objectify", "iterparse"]:
+            with self.subTest(engine=engine):
+                df = XMLParser(engine=engine, sink="polars").parse(self.response_content)
+                self.assertIsInstance(df, pl.DataFrame)
+                self.assertEqual(df.schema["TimeSeries.mRID"], pl.Categorical)
+                self.assertEqual(df["quantity"].to_list(), self.expected["quantity"].to_list())
+                column = "TimeSeries.inBiddingZone_Domain.mRID"
+                self.assertEqual(df[column].null_count(), self.expected[column].isna().sum())
+                self.assertEqual(df[column].drop_nulls().to_list(), self.expected[column].dropna().to_list())
+        df = Parser.parse_many([response(self.response_content)] * 2, sink="polars")
+        self.assertEqual(len(df), len(self.expected))
+
+    @unittest.skipIf(Sinks.pl is None, "polars is not installed")
+    def test_polars_not_categorical(self):
+        pl = Sinks.pl
+        df = XMLParser(sink="polars", categorical=False).parse(self.response_content)
+        column = "TimeSeries.inBiddingZone_Domain.mRID"
+        self.assertEqual(df.schema[column], pl.String)
+        self.assertEqual(df[column].null_count(), self.expected[column].isna().sum())
+        self.assertEqual(df[column].drop_nulls().to_list(), self.expected[column].dropna().to_list())
+        self.assertEqual(df["TimeSeries.mRID"].to_list(), self.expected["TimeSeries.mRID"].to_list())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import unittest
+from collections.abc import Iterator
+from io import BytesIO
+from zipfile import ZipFile
+
+import pandas as pd
+import requests
+
+from entsoe_client.Parsers import Parser, Sinks, XMLParser, ZipParser
+from entsoe_client.Parsers import ParserUtils as utils
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+def make_archive(*xml_documents: bytes) -> bytes:
+    buffer = BytesIO()
+    with ZipFile(buffer, "w") as archive:
+        for i, xml_document in enumerate(xml_documents):
+            archive.writestr(f"{i}.xml", xml_document)
+    return buffer.getvalue()
+
+
+class test_ZipParser(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        path = os.path.join(DATA, "Unavailability_MarketDocument")
+        with open(os.path.join(path, "A78_UnavailabilityOfTransmissionInfrastructure.xml"), "rb") as data:
+            cls.outage = data.read()
+        path = os.path.join(DATA, "GL_MarketDocument", "A75_AggregatedGenerationPerType.xml")
+        with open(path, "rb") as data:
+            cls.generation = data.read()
+
+    def test_members_in_order(self):
+        other = self.outage.replace(b"<code>B19</code>", b"<code>B18</code>")
+        df = ZipParser().parse(make_archive(self.outage, other, self.outage))
+        self.assertEqual(list(df["Reason.code"]), ["B19"] * 2 + ["B18"] * 2 + ["B19"] * 2)
+        self.assertEqual(df["Reason.code"].dtype, "category")
+
+    def test_standard_documents(self):
+        df = ZipParser().parse(make_archive(self.generation, self.generation))
+        expected = XMLParser().parse(self.generation)
+        pd.testing.assert_frame_equal(df, utils.concat_documents([expected, expected]))
+
+    def test_mixed_documents(self):
+        other = self.outage.replace(b"<code>B19</code>", b"<code>  </code>")
+        xml_documents = [self.outage, other, self.generation, self.outage]
+        df = ZipParser().parse(make_archive(*xml_documents))
+        expected = utils.concat_documents([XMLParser().parse(d) for d in xml_documents])
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_workers_equal_serial(self):
+        archive = make_archive(*[self.outage] * 10)
+        expected = ZipParser().parse(archive)
+        pd.testing.assert_frame_equal(ZipParser(workers=2).parse(archive), expected)
+        response = requests.Response()
+        response.headers["Content-Type"] = "application/zip"
+        response._content = archive
+        pd.testing.assert_frame_equal(Parser.parse(response, workers=2), expected)
+
+    @unittest.skipIf(Sinks.pl is None, "polars is not installed")
+    def test_workers_polars_repeated(self):
+        archive = make_archive(*[self.generation] * 4)
+        expected = ZipParser(sink="polars").parse(archive)
+        for _ in range(2):  # The parent's polars thread pool is running now.
+            df = ZipParser(workers=2, sink="polars").parse(archive)
+            self.assertTrue(df.equals(expected))
+
+    def test_iter_parse(self):
+        archive = make_archive(self.outage, self.generation, self.outage)
+        for engine in ["objectify", "iterparse"]:
+            with self.subTest(engine=engine):
+                dfs = ZipParser(engine=engine).iter_parse(BytesIO(archive))
+                self.assertIsInstance(dfs, Iterator)
+                dfs = list(dfs)
+                self.assertEqual(len(dfs), 3)
+                for df, xml_document in zip(dfs, [self.outage, self.generation, self.outage]):
+                    pd.testing.assert_frame_equal(df, XMLParser(engine=engine).parse(xml_document))
+
+
+if __name__ == "__main__":
+    unittest.main()
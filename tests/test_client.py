@@ -1,12 +1,21 @@
+import asyncio
+import io
+import threading
+import time
 import unittest
 import os
+import warnings
+import zipfile
+from unittest import mock
 
 import pandas as pd
+import requests
 from pandas import DataFrame
 
-from entsoe_client import Client, Queries
+from entsoe_client import AsyncClient, Client, Queries
 from entsoe_client.ParameterTypes import *
-from entsoe_client.Parsers import Parser, ParserUtils, XMLParser
+from entsoe_client.Retry import RetryPolicy
+from entsoe_client.Parsers import Parser, ParserUtils, Sinks, XMLParser, ZipParser
 
 
 class ParameterTypeTest(unittest.TestCase):
@@ -107,6 +116,454 @@ class ParserTest(unittest.TestCase):
         self.assertIsInstance(df, pd.DataFrame)
 
 
+def mock_response(params, content=b"<xml/>", status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = "text/xml"
+    response._content = content
+    response.url = repr(sorted(params.items()))
+    return response
+
+
+class MockSession:
+    """Stands in for `requests.Session`; records which thread issued which request."""
+
+    delay = 0.05
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, params=None, proxies=None, timeout=None, stream=False):
+        self.calls.append((threading.get_ident(), dict(params)))
+        time.sleep(self.delay)
+        return mock_response(params)
+
+
+def mock_gl_document(params) -> bytes:
+    """Hourly GL_MarketDocument covering the requested period in daily Periods."""
+    start = Queries.Query.timestamp_parser(params["periodStart"]).floor("D")
+    end = Queries.Query.timestamp_parser(params["periodEnd"]).ceil("D")
+    periods = []
+    for day in pd.date_range(start, end, freq="D", inclusive="left"):
+        points = "".join(
+            f"<Point><position>{h + 1}</position><quantity>{day.day * 100 + h}</quantity></Point>"
+            for h in range(24)
+        )
+        periods.append(
+            f"<Period><timeInterval><start>{day:%Y-%m-%dT%H:%MZ}</start>"
+            f"<end>{day + pd.Timedelta('1D'):%Y-%m-%dT%H:%MZ}</end></timeInterval>"
+            f"<resolution>PT60M</resolution>{points}</Period>"
+        )
+    return (
+        '<GL_MarketDocument xmlns="urn:iec62325.351:tc57wg16:451-6:generationloaddocument:3:0">'
+        f"<mRID>{params['periodStart']}</mRID><type>A65</type>"
+        f"<TimeSeries><mRID>1</mRID><businessType>A04</businessType>{''.join(periods)}</TimeSeries>"
+        "</GL_MarketDocument>"
+    ).encode()
+
+
+class GLSession(MockSession):
+    delay = 0.0
+
+    def get(self, url, params=None, proxies=None, timeout=None, stream=False):
+        self.calls.append((threading.get_ident(), dict(params)))
+        return mock_response(params, content=mock_gl_document(params))
+
+
+class RecordingAdapter(requests.adapters.BaseAdapter):
+    """Transport of a real `requests.Session`; records the requests it sends."""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append((threading.get_ident(), request))
+        response = mock_response({}, content=b"<xml/>")
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def custom_session() -> requests.Session:
+    session = requests.Session()
+    session.headers["User-Agent"] = "custom"
+    session.mount("https://", RecordingAdapter())
+    return session
+
+
+class DownloadDataFrameTest(unittest.TestCase):
+    def test_chunked(self):
+        query = Queries.Load.ActualTotalLoad(Area("CZ"), 202101011200, 202101051200)
+        with mock.patch("entsoe_client.Clients.requests.Session", GLSession):
+            client = Client("key", session=GLSession())
+            whole = Parser.parse(client.download(query))
+            df = client.download_dataframe(
+                query, max_workers=2, range_limit=pd.DateOffset(days=1)
+            )
+        self.assertEqual(len(whole), 5 * 24)
+        self.assertEqual(len(df), len(whole))
+        self.assertTrue(df.index.is_monotonic_increasing)
+        pd.testing.assert_index_equal(df.index, whole.index)
+        self.assertEqual(list(df["quantity"]), list(whole["quantity"]))
+
+
+class PagingSession(MockSession):
+    """Serves `total` outage documents, `document_limit` per archive."""
+
+    delay = 0.0
+    total = 450
+    document_limit = 200
+
+    def get(self, url, params=None, proxies=None, timeout=None, stream=False):
+        self.calls.append((threading.get_ident(), dict(params)))
+        offset = params["offset"]
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for i in range(offset, min(offset + self.document_limit, self.total)):
+                archive.writestr(f"{i}.xml", f"<Unavailability_MarketDocument><mRID>{i}</mRID></Unavailability_MarketDocument>")
+        response = mock_response(params, content=buffer.getvalue())
+        response.headers["Content-Type"] = "application/zip"
+        return response
+
+
+class StreamingSession(PagingSession):
+    """Only serves the body through `iter_content`, as a streamed response would."""
+
+    def get(self, url, params=None, proxies=None, timeout=None, stream=False):
+        response = super().get(url, params={**params, "offset": 0})
+        content = response._content
+        response._content = False
+        response.raw = io.BytesIO(content)
+        return response
+
+
+class StreamingDownloadTest(unittest.TestCase):
+    def test_stream(self):
+        query = Queries.Outages.UnavailabilityOfGenerationUnits(
+            biddingZone_Domain=Area("FR"), periodStart=202108240000, periodEnd=202108250000
+        )
+        client = Client("key", session=StreamingSession())
+        response = client.download(query, stream=True)
+        self.assertTrue(hasattr(response, "fileobj"))
+        with ZipParser.open_archive(Parser.get_content(response)) as archive:
+            self.assertEqual(len(archive.infolist()), 200)
+        self.assertEqual(len(ZipParser.unpack_archive(Parser.get_content(response))), 200)
+
+    def test_parse_fileobj(self):
+        content = mock_gl_document({"periodStart": 202101010000, "periodEnd": 202101020000})
+        response = mock_response({}, content=content)
+        expected = Parser.parse(response)
+        response.fileobj = io.BytesIO(content)
+        pd.testing.assert_frame_equal(Parser.parse(response), expected)
+
+
+class DownloadPaginatedTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.query = Queries.Outages.UnavailabilityOfGenerationUnits(
+            biddingZone_Domain=Area("FR"), periodStart=202108240000, periodEnd=202108250000
+        )
+
+    def test_pages_merged(self):
+        with mock.patch("entsoe_client.Clients.requests.Session", PagingSession):
+            session = PagingSession()
+            client = Client("key", session=session)
+            response = client.download_paginated(self.query, max_workers=2)
+        self.assertEqual(ZipParser.count_documents(response.content), 450)
+        self.assertEqual(session.calls[0][1]["offset"], 0)
+        self.assertIsNone(self.query.offset)
+
+    def test_ceiling_warning(self):
+        class UnlimitedSession(PagingSession):
+            total = 10**6
+
+        with mock.patch("entsoe_client.Clients.requests.Session", UnlimitedSession):
+            client = Client("key", session=UnlimitedSession())
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                response = client.download_paginated(self.query, max_workers=8)
+        self.assertEqual(ZipParser.count_documents(response.content), 5000)
+        self.assertTrue(any("5000 documents" in str(w.message) for w in caught))
+
+    def test_async_client(self):
+        with mock.patch("entsoe_client.Clients.requests.Session", PagingSession):
+            client = AsyncClient("key", max_concurrency=2)
+            response = asyncio.run(client.download_paginated(self.query, max_workers=4))
+            client.close()
+        self.assertEqual(ZipParser.count_documents(response.content), 450)
+
+    def test_unpaged_query(self):
+        with self.assertRaises(ValueError):
+            Client("key").download_paginated(Queries.Load.ActualTotalLoad(Area("CZ"), 202101010000, 202101020000))
+
+    def test_merge_xml(self):
+        documents = [
+            mock_gl_document({"periodStart": 202101010000, "periodEnd": 202101020000}),
+            mock_gl_document({"periodStart": 202101020000, "periodEnd": 202101030000}),
+        ]
+        merged = XMLParser.merge_documents(documents)
+        self.assertEqual(XMLParser.count_documents(merged), 2)
+        df = XMLParser().parse(merged)
+        self.assertEqual(len(df), 48)
+
+
+class CoalescingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.query = Queries.Load.ActualTotalLoad(Area("CZ"), 202101010000, 202101030000)
+
+    def run_concurrently(self, fn, n=8):
+        barrier = threading.Barrier(n)
+        results = [None] * n
+
+        def target(i):
+            barrier.wait()
+            results[i] = fn()
+
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(n)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_download(self):
+        calls = []
+
+        class SlowSession(GLSession):
+            def get(self, *args, **kwargs):
+                calls.append(1)
+                time.sleep(0.2)
+                return super().get(*args, **kwargs)
+
+        with mock.patch("entsoe_client.Clients.requests.Session", SlowSession):
+            client = Client("key")
+            responses = self.run_concurrently(lambda: client.download(self.query))
+            self.assertEqual(len(calls), 1)
+            self.assertTrue(all(r is responses[0] for r in responses))
+
+            client = Client("key", coalesce=False)
+            self.run_concurrently(lambda: client.download(self.query), n=3)
+            self.assertEqual(len(calls), 4)
+
+    def test_download_dataframe(self):
+        calls = []
+
+        class SlowSession(GLSession):
+            def get(self, *args, **kwargs):
+                calls.append(1)
+                time.sleep(0.2)
+                return super().get(*args, **kwargs)
+
+        with mock.patch("entsoe_client.Clients.requests.Session", SlowSession):
+            client = Client("key")
+            dfs = self.run_concurrently(lambda: client.download_dataframe(self.query), n=4)
+        self.assertEqual(len(calls), 1)
+        for df in dfs[1:]:
+            pd.testing.assert_frame_equal(df, dfs[0])
+        self.assertEqual(len({id(df) for df in dfs}), 4)
+
+
+    def test_download_dataframe_sinks(self):
+        class SlowSession(GLSession):
+            def get(self, *args, **kwargs):
+                time.sleep(0.2)
+                return super().get(*args, **kwargs)
+
+        sinks = ["pandas"] + [sink for sink, module in [("pyarrow", Sinks.pa), ("polars", Sinks.pl)] if module]
+        for sink in sinks:
+            with self.subTest(sink=sink):
+                with mock.patch("entsoe_client.Clients.requests.Session", SlowSession):
+                    client = Client("key")
+                    results = self.run_concurrently(
+                        lambda: client.download_dataframe(self.query, normalized=True, sink=sink), n=3
+                    )
+                self.assertTrue(all(isinstance(tables, ParserUtils.Tables) for tables in results))
+                for tables in results[1:]:
+                    self.assertTrue(tables.values.equals(results[0].values))
+                    if sink != "pyarrow":
+                        self.assertIsNot(tables.values, results[0].values)
+
+
+class DownloadManyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.queries = [
+            Queries.Load.ActualTotalLoad(Area("CZ"), 201512312300 + i, 201612312300)
+            for i in range(6)
+        ]
+
+    def test_ordered(self):
+        with mock.patch("entsoe_client.Clients.requests.Session", MockSession):
+            client = Client("key")
+            results = list(client.download_many(self.queries, max_workers=3))
+        self.assertEqual([r.query for r in results], self.queries)
+        self.assertTrue(all(r.ok for r in results))
+        for query, result in zip(self.queries, results):
+            self.assertIn(str(query.periodStart), result.response.url)
+
+    def test_custom_session(self):
+        session = custom_session()
+        results = list(Client("key", session=session).download_many(self.queries, max_workers=3))
+        self.assertTrue(all(r.ok for r in results))
+        adapter = session.get_adapter("https://")
+        self.assertEqual(len(adapter.requests), len(self.queries))
+        self.assertGreater(len({thread for thread, _ in adapter.requests}), 1)
+        for _, request in adapter.requests:
+            self.assertEqual(request.headers["User-Agent"], "custom")
+
+    def test_params_not_mutated(self):
+        params = self.queries[0]()
+        session = MockSession()
+        Client("key", session=session)._request(params)
+        self.assertNotIn("securityToken", params)
+        self.assertEqual(session.calls[0][1]["securityToken"], "key")
+
+    def test_errors_captured(self):
+        class FailingSession(MockSession):
+            def get(self, url, params=None, **kwargs):
+                if params["periodStart"] % 2:
+                    raise requests.exceptions.ConnectionError(params["periodStart"])
+                return super().get(url, params=params, **kwargs)
+
+        with mock.patch("entsoe_client.Clients.requests.Session", FailingSession):
+            client = Client("key", retry_policy=RetryPolicy(max_attempts=1))
+            results = list(
+                client.download_many(self.queries, max_workers=3, ordered=False)
+            )
+        self.assertEqual(len(results), len(self.queries))
+        failed = [r for r in results if not r.ok]
+        self.assertEqual(len(failed), 3)
+        for result in failed:
+            self.assertIsNone(result.response)
+            self.assertIsInstance(result.exception, requests.exceptions.ConnectionError)
+
+
+class AsyncClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.queries = [
+            Queries.Load.ActualTotalLoad(Area("CZ"), 201512312300 + i, 201612312300)
+            for i in range(8)
+        ]
+
+    def test_download(self):
+        with mock.patch("entsoe_client.Clients.requests.Session", MockSession):
+            client = AsyncClient("key", max_concurrency=2)
+            response = asyncio.run(client(self.queries[0]))
+            client.close()
+        self.assertEqual(response.status_code, 200)
+
+    def test_custom_session(self):
+        session = custom_session()
+        client = AsyncClient("key", session=session, max_concurrency=2)
+
+        async def download_all():
+            return await asyncio.gather(*(client.download(query) for query in self.queries))
+
+        responses = asyncio.run(download_all())
+        client.close()
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+        adapter = session.get_adapter("https://")
+        self.assertEqual(len(adapter.requests), len(self.queries))
+        self.assertNotIn(threading.get_ident(), {thread for thread, _ in adapter.requests})
+        for _, request in adapter.requests:
+            self.assertEqual(request.headers["User-Agent"], "custom")
+        self.assertNotIn("securityToken", session.params)
+
+    def test_download_many_bounded(self):
+        in_flight, peak = 0, 0
+        lock = threading.Lock()
+
+        class CountingSession(MockSession):
+            def get(self, *args, **kwargs):
+                nonlocal in_flight, peak
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                try:
+                    return super().get(*args, **kwargs)
+                finally:
+                    with lock:
+                        in_flight -= 1
+
+        async def collect(client):
+            return [pair async for pair in client.download_many(self.queries)]
+
+        with mock.patch("entsoe_client.Clients.requests.Session", CountingSession):
+            client = AsyncClient("key", max_concurrency=3)
+            results = asyncio.run(collect(client))
+            client.close()
+
+        self.assertEqual(len(results), len(self.queries))
+        self.assertEqual(
+            sorted(id(query) for query, _ in results),
+            sorted(id(query) for query in self.queries),
+        )
+        self.assertGreater(peak, 1)
+        self.assertLessEqual(peak, 3)
+
+
+    def test_batches_bounded(self):
+        in_flight, peak = 0, 0
+        lock = threading.Lock()
+
+        class CountingSession(GLSession):
+            def get(self, *args, **kwargs):
+                nonlocal in_flight, peak
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                try:
+                    time.sleep(0.02)
+                    return super().get(*args, **kwargs)
+                finally:
+                    with lock:
+                        in_flight -= 1
+
+        queries = [
+            Queries.Load.ActualTotalLoad(Area(area), 202101010000, 202101050000)
+            for area in ["CZ", "DE_LU", "FR"]
+        ]
+
+        async def collect(client):
+            return [pair async for pair in client.download_many(self.queries)]
+
+        async def run(client):
+            frames = [
+                client.download_dataframe(query, range_limit=pd.DateOffset(days=1))
+                for query in queries
+            ]
+            many, *frames = await asyncio.gather(collect(client), *frames)
+            return frames, many
+
+        with mock.patch("entsoe_client.Clients.requests.Session", CountingSession):
+            client = AsyncClient("key", max_concurrency=2)
+            frames, many = asyncio.run(run(client))
+            client.close()
+
+        self.assertEqual(len(frames), len(queries))
+        self.assertEqual(len(many), len(self.queries))
+        self.assertGreater(peak, 1)
+        self.assertLessEqual(peak, 2)
+
+    def test_download_dataframe(self):
+        query = Queries.Load.ActualTotalLoad(Area("CZ"), 202101010000, 202101030000)
+        with mock.patch("entsoe_client.Clients.requests.Session", GLSession):
+            expected = Client("key").download_dataframe(query, range_limit=pd.DateOffset(days=1))
+            client = AsyncClient("key", max_concurrency=2)
+            df = asyncio.run(client.download_dataframe(query, range_limit=pd.DateOffset(days=1)))
+            client.close()
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_download_result(self):
+        with mock.patch("entsoe_client.Clients.requests.Session", MockSession):
+            client = AsyncClient("key", max_concurrency=2)
+            result = client._download_result(self.queries[0])
+            client.close()
+        self.assertTrue(result.ok)
+        self.assertIsInstance(result.response, requests.Response)
+
+
 class IntegrationTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None: